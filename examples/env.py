@@ -1,14 +1,7 @@
 import logging
-# Configure the root logger
-logging.basicConfig(
-    level=logging.INFO,  # Set the log level for the entire application, change to DEBUG to print all responses.
-    format='[%(asctime)s - %(name)s] - %(levelname)s - %(message)s',  # Consistent format
-    handlers=[
-        logging.FileHandler("app.log"),  # Log to a file
-        logging.StreamHandler()  # Log to console
-    ]
-)
-log = logging.getLogger("ExampleLog")
+from xmrig import logging_setup
+# Configure logging to a file and the console, change the level to logging.DEBUG to print all responses.
+log = logging_setup("ExampleLog", level=logging.INFO)
 name_a = "MinerA"
 ip_a = "127.0.0.1"
 port_a = 37841
@@ -1,15 +1,15 @@
 from env import log, name_a, ip_a, port_a, access_token_a, tls_enabled_a, name_b, ip_b, port_b, access_token_b, tls_enabled_b
-from xmrig import XMRigManager
+from xmrig import default_manager
 
-manager = XMRigManager()
+manager = default_manager()
 log.info("Adding miners to the manager...")
 manager.add_miner(name_a, ip_a, port_a, access_token_a, tls_enabled_a)
 manager.add_miner(name_b, ip_b, port_b, access_token_b, tls_enabled_b)
 miner_a = manager.get_miner(name_a)
 miner_b = manager.get_miner(name_b)
 log.info("Listing all miners")
-log.info(manager.list_miners())
+log.info("Miners: %s", manager.list_miners())
 log.info("Removing MinerB")
 manager.remove_miner("MinerB")
 log.info("Listing all miners after removal")
-log.info(manager.list_miners())
\ No newline at end of file
+log.info("Miners: %s", manager.list_miners())
\ No newline at end of file
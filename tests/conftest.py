@@ -0,0 +1,11 @@
+import os, pytest
+
+@pytest.fixture(autouse=True, scope="session")
+def repo_root():
+    """
+    Runs the tests from the root of the repo, where the example API responses they load are located.
+    """
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    yield
+    os.chdir(cwd)
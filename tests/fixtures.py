@@ -0,0 +1,18 @@
+import functools
+from xmrig.api import json_loads
+
+@functools.lru_cache(maxsize=None)
+def load_fixture(endpoint):
+    """
+    Loads the example API response for an endpoint, parsing each file only once per test run.
+
+    The parsed data is shared between every test class that loads it, so it must be treated as read only.
+
+    Args:
+        endpoint (str): The endpoint to load the example response for, one of 'summary', 'backends' or 'config'.
+
+    Returns:
+        dict | list: The parsed example response.
+    """
+    with open(f"api/{endpoint}.json", "rb") as f:
+        return json_loads(f.read())
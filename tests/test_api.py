@@ -1,68 +1,317 @@
-import unittest, json
+import unittest, json, asyncio, time, os, tempfile, threading, requests
+from urllib.parse import urlsplit
+from datetime import datetime, timedelta
 from unittest.mock import patch
 from xmrig.api import XMRigAPI
+from tests.fixtures import load_fixture
+from xmrig.db import XMRigDatabase
+from xmrig.exceptions import XMRigAPIError, XMRigAuthorizationError, XMRigConnectionError
+
+class FakeResponse:
+    """
+    Minimal stand-in for the parts of requests.Response used by XMRigAPI, far cheaper to create than a MagicMock.
+    """
+
+    __slots__ = ("status_code", "content")
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
 
 class TestXMRigAPI(unittest.TestCase):
 
-    @patch('xmrig.api.XMRigAPI.get_all_responses', return_value=True)
-    def setUp(self, mock_get_all_responses):
-        with open("api/summary.json", "r") as f:
-            self.summary = json.loads(f.read())
-        with open("api/backends.json", "r") as f:
-            self.backends = json.loads(f.read())
-        with open("api/config.json", "r") as f:
-            self.config = json.loads(f.read())
+    @classmethod
+    def setUpClass(cls):
+        # The fixtures are only read by the tests, so they are parsed once and shared between test classes.
+        cls.summary = load_fixture("summary")
+        cls.backends = load_fixture("backends")
+        cls.config = load_fixture("config")
+        # Status code and body returned for each (method, path) requested through the session
+        cls.routes = {
+            ("GET", "/2/summary"): (200, json.dumps(cls.summary).encode()),
+            ("GET", "/2/backends"): (200, json.dumps(cls.backends).encode()),
+            ("GET", "/2/config"): (200, json.dumps(cls.config).encode()),
+            ("POST", "/2/config"): (200, b""),
+            ("POST", "/json_rpc"): (200, b'{"id": 1, "jsonrpc": "2.0", "result": {"status": "OK"}}'),
+        }
+
+    def setUp(self):
+        # All HTTP requests are answered from the routes table, tests can replace a route to change its response
+        self.routes = dict(self.routes)
+        self.mock_http_get = patch('xmrig.api.XMRigAPI._http_get', side_effect=self._route_get).start()
+        self.mock_request = patch('xmrig.api.requests.Session.request', side_effect=self._route).start()
+        self.addCleanup(patch.stopall)
         self.api = XMRigAPI("test_miner", "127.0.0.1", "8080")
+        self.addCleanup(self.api.close)
         self.api._update_cache(self.summary, "summary")
         self.api._update_cache(self.backends, "backends")
         self.api._update_cache(self.config, "config")
 
-    @patch('xmrig.api.requests.get')
-    def test_get_endpoint_summary(self, mock_get):
-        mock_get.return_value.json.return_value = self.summary
-        mock_get.return_value.status_code = 200
+    def _route(self, method, url, **kwargs):
+        status_code, content = self.routes[(method, urlsplit(url).path)]
+        return FakeResponse(status_code, content)
+
+    def _route_get(self, url):
+        return self.routes[("GET", urlsplit(url).path)]
+
+    def test_get_endpoint_summary(self):
         self.assertTrue(self.api.get_endpoint("summary"))
 
-    @patch('xmrig.api.requests.get')
-    def test_get_endpoint_backends(self, mock_get):
-        mock_get.return_value.json.return_value = self.backends
-        mock_get.return_value.status_code = 200
+    def test_get_endpoint_backends(self):
         self.assertTrue(self.api.get_endpoint("backends"))
 
-    @patch('xmrig.api.requests.get')
-    def test_get_endpoint_config(self, mock_get):
-        mock_get.return_value.json.return_value = self.config
-        mock_get.return_value.status_code = 200
+    def test_get_endpoint_config(self):
         self.assertTrue(self.api.get_endpoint("config"))
 
-    @patch('xmrig.api.requests.post')
+    def test_get_endpoint_malformed_json(self):
+        self.routes[("GET", "/2/backends")] = (200, b'{"malformed": ')
+        self.assertFalse(self.api.get_endpoint("backends"))
+
+    @patch('xmrig.api.json_loads', json.loads)
+    def test_get_endpoint_non_utf8_body_without_orjson(self):
+        self.routes[("GET", "/2/backends")] = (200, b'\xff\xfe{"malformed": ')
+        self.assertFalse(self.api.get_endpoint("backends"))
+
+    def test_get_endpoint_unauthorized(self):
+        self.routes[("GET", "/2/summary")] = (401, b"")
+        with self.assertRaises(XMRigAuthorizationError):
+            self.api.get_endpoint("summary")
+
+    def test_get_endpoint_timeout(self):
+        self.mock_http_get.side_effect = requests.exceptions.ConnectTimeout("timed out")
+        with self.assertRaises(XMRigConnectionError):
+            self.api.get_endpoint("summary", force_refresh=True)
+
+    def test_get_endpoint_served_from_fresh_cache(self):
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.mock_http_get.assert_called_once()
+
+    def test_get_endpoint_force_refresh(self):
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.assertTrue(self.api.get_endpoint("summary", force_refresh=True))
+        self.assertEqual(self.mock_http_get.call_count, 2)
+
+    def test_set_ttl(self):
+        self.api.set_ttl(0, "summary")
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.assertEqual(self.mock_http_get.call_count, 2)
+        with self.assertRaises(XMRigAPIError):
+            self.api.set_ttl(-1)
+
+    @patch('xmrig.api.XMRigAPI._fetch_endpoint', return_value=True)
+    def test_get_endpoint_stale_cache_refreshed_in_background(self, mock_fetch_endpoint):
+        self.api._cache_fetched_at["summary"] = time.monotonic() - self.api._cache_ttl["summary"] * 1.5
+        self.assertTrue(self.api.get_endpoint("summary"))
+        self.api._refresh_futures["summary"].result()
+        mock_fetch_endpoint.assert_called_once_with("summary")
+
+    def test_endpoints_fetched_on_first_read(self):
+        responses = {"summary": self.summary, "backends": self.backends, "config": self.config}
+        def fetch(api, endpoint, pending_writes=None):
+            api._update_cache(responses[endpoint], endpoint)
+            return True
+        with patch('xmrig.api.XMRigAPI._fetch_endpoint', autospec=True, side_effect=fetch) as mock_fetch:
+            api = XMRigAPI("lazy_miner", "127.0.0.1", "8080")
+            self.addCleanup(api.close)
+            mock_fetch.assert_not_called()
+            self.assertEqual(api.sum_id, self.summary["id"])
+            mock_fetch.assert_called_once_with(api, "summary", None)
+            self.assertEqual(api._property_memo["summary"], {"sum_id": self.summary["id"]})
+            self.assertEqual(api.sum_version, self.summary["version"])
+            mock_fetch.assert_called_once()
+
+    def test_refresh_fetches_fresh_endpoints(self):
+        with patch('xmrig.api.XMRigAPI._fetch_endpoint', return_value=True) as mock_fetch:
+            self.assertTrue(self.api.refresh())
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    def test_backends_properties_reset_on_cache_update(self):
+        self.assertEqual(self.api.be_cpu_algo, self.backends[0]["algo"])
+        updated_backends = json.loads(json.dumps(self.backends))
+        updated_backends[0]["algo"] = "updated-algo"
+        self.api._update_cache(updated_backends, "backends")
+        self.assertEqual(self.api.be_cpu_algo, "updated-algo")
+
+    def test_auth_header_only_sent_with_token(self):
+        self.assertNotIn("Authorization", self.api._headers)
+        self.api.set_auth_header("SECRET")
+        self.assertEqual(self.api._headers["Authorization"], "Bearer SECRET")
+
+    def test_missing_backend_returns_none(self):
+        self.api._update_cache(self.backends[:1], "backends")
+        self.assertIsNone(self.api.be_cuda_type)
+
+    def test_thread_properties_without_threads_return_none(self):
+        self.api._update_cache(self.backends[:1], "backends")
+        self.assertIsNone(self.api.be_opencl_threads_health_rpm)
+        self.assertIsNone(self.api.be_cuda_threads_name)
+
+    def test_cpu_thread_properties_with_incomplete_thread_return_none(self):
+        backends = json.loads(json.dumps(self.backends))
+        del backends[0]["threads"][0]["affinity"]
+        self.api._update_cache(backends, "backends")
+        self.assertIsNone(self.api.be_cpu_threads_intensity)
+        self.assertIsNone(self.api.be_cpu_threads_hashrates_10s)
+
+    def test_pool_properties_with_non_dict_pool_return_none(self):
+        config = json.loads(json.dumps(self.config))
+        config["pools"].append(None)
+        self.api._update_cache(config, "config")
+        self.assertIsNone(self.api.conf_pools_rig_id_property)
+        self.assertIsNone(self.api.conf_pools_url_property)
+
+    def test_hashrate_periods_with_short_list_return_none(self):
+        summary = json.loads(json.dumps(self.summary))
+        summary["hashrate"]["total"] = [100.0]
+        self.api._update_cache(summary, "summary")
+        self.assertEqual(self.api.sum_hashrate_10s, 100.0)
+        self.assertIsNone(self.api.sum_hashrate_1m)
+        self.assertIsNone(self.api.sum_hashrate_15m)
+        backends = json.loads(json.dumps(self.backends))
+        backends[0]["hashrate"] = []
+        self.api._update_cache(backends, "backends")
+        self.assertIsNone(self.api.be_cpu_hashrate_10s)
+
+    def test_enabled_backends_skips_disabled_and_missing(self):
+        backends = json.loads(json.dumps(self.backends[:2]))
+        backends[1]["enabled"] = False
+        backends.append(None)
+        self.api._update_cache(backends, "backends")
+        self.assertEqual(self.api.enabled_backends, [self.backends[0]["type"]])
+
+    @patch('xmrig.api.XMRigDatabase.retrieve_data_from_db')
+    def test_enabled_backends_falls_back_to_db(self, mock_retrieve_data_from_db):
+        mock_retrieve_data_from_db.return_value = [{"full_json": self.backends}]
+        self.api._db_url = "sqlite:///test.db"
+        self.api._update_cache(None, "backends")
+        self.api._lazy_fetched.add("backends")
+        self.assertEqual(self.api.enabled_backends, ["cpu", "opencl", "cuda"])
+
+    @patch('xmrig.api.XMRigDatabase.retrieve_data_from_db')
+    def test_db_fallback_values_not_memoized(self, mock_retrieve_data_from_db):
+        mock_retrieve_data_from_db.return_value = [{"worker_id": "db-worker"}]
+        self.api._db_url = "sqlite:///test.db"
+        self.api._update_cache(None, "summary")
+        self.api._lazy_fetched.add("summary")
+        self.assertEqual(self.api.sum_worker_id, "db-worker")
+        mock_retrieve_data_from_db.return_value = [{"worker_id": "newer-worker"}]
+        self.assertEqual(self.api.sum_worker_id, "newer-worker")
+        self.assertEqual(mock_retrieve_data_from_db.call_count, 2)
+
+    def test_summary_properties_reset_on_cache_update(self):
+        self.assertEqual(self.api.sum_worker_id, self.summary["worker_id"])
+        updated_summary = dict(self.summary, worker_id="updated-worker")
+        self.api._update_cache(updated_summary, "summary")
+        self.assertEqual(self.api.sum_worker_id, "updated-worker")
+
     @patch('xmrig.api.XMRigAPI.get_endpoint', return_value=True)
-    def test_post_config(self, mock_get_endpoint, mock_post):
-        mock_post.return_value.status_code = 200
-        test_config = self.config
+    def test_post_config(self, mock_get_endpoint):
+        test_config = json.loads(json.dumps(self.config))
         test_config["api"]["id"] = "test_miner"
         self.assertTrue(self.api.post_config(test_config))
 
-    @patch('xmrig.api.requests.post')
-    def test_perform_action_pause(self, mock_post):
-        mock_post.return_value.status_code = 200
+    @patch('xmrig.api.XMRigAPI.get_endpoint', return_value=True)
+    def test_patch_config(self, mock_get_endpoint):
+        self.assertTrue(self.api.patch_config(("api", "worker-id"), "NEW_WORKER_ID"))
+        posted = json.loads(self.mock_request.call_args.kwargs["data"])
+        self.assertEqual(posted["api"]["worker-id"], "NEW_WORKER_ID")
+        self.assertEqual(posted["pools"], self.config["pools"])
+        self.assertEqual(self.api._config_cache["api"]["worker-id"], self.config["api"]["worker-id"])
+        self.assertNotEqual(self.config["api"]["worker-id"], "NEW_WORKER_ID")
+
+    def test_perform_action_pause(self):
         self.assertTrue(self.api.perform_action("pause"))
+        posted = json.loads(self.mock_request.call_args.kwargs["data"])
+        self.assertEqual(posted, {"method": "pause", "jsonrpc": "2.0", "id": 1})
+        self.assertEqual(self.mock_request.call_args.kwargs["timeout"], (1.0, 3.0))
 
-    @patch('xmrig.api.requests.post')
-    def test_perform_action_resume(self, mock_post):
-        mock_post.return_value.status_code = 200
+    def test_perform_action_resume(self):
         self.assertTrue(self.api.perform_action("resume"))
 
-    @patch('xmrig.api.requests.post')
-    def test_perform_action_stop(self, mock_post):
-        mock_post.return_value.status_code = 200
+    def test_perform_action_stop(self):
         self.assertTrue(self.api.perform_action("stop"))
 
-    @patch('xmrig.api.requests.post')
     @patch('xmrig.api.XMRigAPI.get_endpoint', return_value=True)
-    def test_perform_action_start(self, mock_get_endpoint, mock_post):
-        mock_post.return_value.status_code = 200
+    def test_perform_action_start(self, mock_get_endpoint):
         self.assertTrue(self.api.perform_action("start"))
 
+    @patch('xmrig.api.XMRigDatabase._insert_many_to_db')
+    def test_get_all_responses_async(self, mock_insert_many_to_db):
+        self.api._db_url = "sqlite:///test.db"
+        self.assertTrue(asyncio.run(self.api.get_all_responses_async()))
+        self.assertEqual(self.mock_http_get.call_count, 3)
+        mock_insert_many_to_db.assert_called_once()
+
+    def test_get_all_responses(self):
+        self.assertTrue(self.api.get_all_responses())
+        self.assertEqual(self.mock_http_get.call_count, 3)
+        self.assertEqual(self.api._config_cache, self.config)
+
+    @patch('xmrig.api.XMRigDatabase._insert_many_to_db')
+    def test_get_all_responses_single_db_write(self, mock_insert_many_to_db):
+        self.api._db_url = "sqlite:///test.db"
+        self.assertTrue(self.api.get_all_responses())
+        mock_insert_many_to_db.assert_called_once()
+        items, miner, db_url = mock_insert_many_to_db.call_args.args
+        self.assertEqual(sorted(endpoint for data, endpoint in items), ["backends", "config", "summary"])
+
+    @patch('xmrig.api.XMRigDatabase._insert_many_to_db')
+    def test_get_all_responses_stores_fetched_when_one_fails(self, mock_insert_many_to_db):
+        self.api._db_url = "sqlite:///test.db"
+        summary_failed = threading.Event()
+        def fail_summary(url):
+            if urlsplit(url).path == "/2/summary":
+                summary_failed.set()
+                raise requests.exceptions.ConnectionError("connection refused")
+            # Only return once the summary fetch has failed
+            self.assertTrue(summary_failed.wait(timeout=5))
+            return self._route_get(url)
+        self.mock_http_get.side_effect = fail_summary
+        with self.assertRaises(XMRigConnectionError):
+            self.api.get_all_responses(force_refresh=True)
+        mock_insert_many_to_db.assert_called_once()
+        items, miner, db_url = mock_insert_many_to_db.call_args.args
+        self.assertEqual(sorted(endpoint for data, endpoint in items), ["backends", "config"])
+
+    def test_cache_loaded_from_db(self):
+        db_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'xmrig-api.db')}"
+        XMRigDatabase._init_db(db_url)
+        XMRigDatabase._insert_data_to_db(self.summary, "test_miner", "summary", db_url)
+        api = XMRigAPI("test_miner", "127.0.0.1", "8080", db_url=db_url)
+        self.addCleanup(api.close)
+        self.assertEqual(api._summary_cache, self.summary)
+        self.assertIsNotNone(api._cache_fetched_at["summary"])
+        self.assertIsNone(api._cache_fetched_at["backends"])
+
+    def test_cache_load_from_uninitialized_db_is_logged(self):
+        api = XMRigAPI("test_miner", "127.0.0.1", "8080", db_url="sqlite:///:memory:")
+        self.addCleanup(api.close)
+        self.assertIsNone(api._summary_cache)
+        self.assertEqual(api._cache_fetched_at, {"summary": None, "backends": None, "config": None})
+
+    def test_cache_ttl_widens_db_load_window(self):
+        db_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'xmrig-api.db')}"
+        XMRigDatabase._init_db(db_url)
+        XMRigDatabase._insert_data_to_db(self.summary, "test_miner", "summary", db_url)
+        with patch('xmrig.api.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() + timedelta(seconds=30)
+            api = XMRigAPI("test_miner", "127.0.0.1", "8080", db_url=db_url)
+            self.addCleanup(api.close)
+            self.assertIsNone(api._summary_cache)
+            api = XMRigAPI("test_miner", "127.0.0.1", "8080", db_url=db_url, cache_ttl={"summary": 60})
+            self.addCleanup(api.close)
+        self.assertEqual(api._summary_cache, self.summary)
+        self.assertEqual(api._cache_ttl["summary"], 60)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,30 @@
+import unittest, logging, os, tempfile
+import xmrig.logger
+from xmrig.logger import logging_setup
+
+class TestLoggingSetup(unittest.TestCase):
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.handlers = list(self.root.handlers)
+        self.level = self.root.level
+        self.log_file = os.path.join(tempfile.mkdtemp(), "app.log")
+
+    def tearDown(self):
+        if xmrig.logger._listener is not None:
+            handlers = xmrig.logger._listener.handlers
+            xmrig.logger._stop_listener()
+            for handler in handlers:
+                handler.close()
+        self.root.handlers = self.handlers
+        self.root.setLevel(self.level)
+
+    def test_logging_setup_installs_handlers_once(self):
+        log = logging_setup("TestLog", file=self.log_file)
+        self.assertEqual(log.name, "TestLog")
+        self.assertEqual(len(self.root.handlers), len(self.handlers) + 1)
+        logging_setup("TestLog", file=self.log_file)
+        self.assertEqual(len(self.root.handlers), len(self.handlers) + 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,18 @@
-import unittest
+import unittest, os, tempfile
 from unittest.mock import patch, MagicMock
-from xmrig.manager import XMRigManager
+from xmrig.manager import XMRigManager, default_manager
 from xmrig.api import XMRigAPI
+from xmrig.exceptions import XMRigManagerError
 
 class TestXMRigManager(unittest.TestCase):
 
     def setUp(self):
-        self.manager = XMRigManager()
+        # Each test gets its own database so results do not depend on data left by earlier runs
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        self.db_url = f"sqlite:///{os.path.join(db_dir.name, 'xmrig-api.db')}"
+        self.manager = XMRigManager(db_url=self.db_url)
+        self.addCleanup(self.manager.close)
 
     @patch('requests.get')
     @patch('xmrig.manager.XMRigAPI.get_endpoint', return_value=True)
@@ -18,13 +24,51 @@ class TestXMRigManager(unittest.TestCase):
         self.manager.add_miner("test_miner", "127.0.0.1", 8080)
         self.assertIn("test_miner", self.manager._miners)
 
+    def test_add_miner_is_idempotent(self):
+        miner = self.manager.add_miner("test_miner", "127.0.0.1", 8080)
+        self.assertIs(self.manager.add_miner("test_miner", "127.0.0.1", 8080), miner)
+        with self.assertRaises(XMRigManagerError):
+            self.manager.add_miner("test_miner", "127.0.0.1", 8081)
+
+    def test_edit_miner_rebuilds_urls(self):
+        miner = self.manager.add_miner("test_miner", "127.0.0.1", 8080)
+        miner._update_cache({"id": "old-host"}, "summary")
+        miner._cache_fetched_at["summary"] = 0
+        self.assertEqual(miner.sum_id, "old-host")
+        miner = self.manager.edit_miner("test_miner", {"port": 8081, "tls_enabled": True, "access_token": "new-token"})
+        self.assertEqual(miner._summary_url, "https://127.0.0.1:8081/2/summary")
+        self.assertEqual(miner._json_rpc_url, "https://127.0.0.1:8081/json_rpc")
+        self.assertEqual(miner._headers["Authorization"], "Bearer new-token")
+        self.assertIsNone(miner._summary_cache)
+        self.assertIsNone(miner._cache_fetched_at["summary"])
+        self.assertEqual(miner._property_memo["summary"], {})
+        self.manager.edit_miner("test_miner", {"access_token": None})
+        self.assertNotIn("Authorization", miner._headers)
+
+    def test_default_manager(self):
+        default_manager.cache_clear()
+        self.addCleanup(default_manager.cache_clear)
+        with patch('xmrig.manager._DEFAULT_DB_URL', self.db_url):
+            manager = default_manager()
+            self.assertIs(default_manager(), manager)
+        self.assertEqual(manager._db_url, self.db_url)
+
     @patch('xmrig.manager.XMRigDatabase._delete_all_miner_data_from_db')
     def test_remove_miner(self, mock_delete_all_miner_data_from_db):
-        self.manager._miners["test_miner"] = MagicMock()
+        miner = self.manager._miners["test_miner"] = MagicMock()
         self.manager.remove_miner("test_miner")
         self.assertNotIn("test_miner", self.manager._miners)
+        miner.close.assert_called_once()
         mock_delete_all_miner_data_from_db.assert_called_once()
 
+    def test_close_closes_miners_and_pool(self):
+        miner = self.manager._miners["test_miner"] = MagicMock()
+        with self.manager as manager:
+            self.assertIs(manager, self.manager)
+        miner.close.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            self.manager._pool.submit(print)
+
     def test_get_miner(self):
         self.manager._miners["test_miner"] = MagicMock()
         miner = self.manager.get_miner("test_miner")
@@ -36,9 +80,32 @@ class TestXMRigManager(unittest.TestCase):
         mock_get_all_responses.return_value = True
         self.assertTrue(self.manager.update_miners())
 
-    def test_list_miners(self):
-        self.manager._miners["test_miner"] = MagicMock()
+    def test_perform_action_on_all_continues_after_failure(self):
+        failing_miner = MagicMock()
+        failing_miner.perform_action.side_effect = Exception("Connection refused")
+        working_miner = MagicMock()
+        working_miner.perform_action.return_value = True
+        self.manager._miners["failing_miner"] = failing_miner
+        self.manager._miners["working_miner"] = working_miner
+        with self.assertRaises(XMRigManagerError):
+            self.manager.perform_action_on_all("pause")
+        working_miner.perform_action.assert_called_once_with("pause")
+
+    def test_fleet_hashrate(self):
+        self.manager._miners["miner_a"] = MagicMock(_summary_cache={"hashrate": {"total": [100.0, 90.0, None]}})
+        self.manager._miners["miner_b"] = MagicMock(_summary_cache={"hashrate": {"total": [50.0, 45.0, 40.0]}})
+        self.manager._miners["miner_c"] = MagicMock(_summary_cache=None)
+        self.assertEqual(self.manager.fleet_hashrate(), [150.0, 135.0, 40.0])
+        self.manager._miners["miner_c"].get_endpoint.assert_not_called()
+
+    @patch('xmrig.manager.XMRigDatabase._delete_all_miner_data_from_db')
+    def test_list_miners(self, mock_delete_all_miner_data_from_db):
+        self.manager.add_miner("test_miner", "127.0.0.1", 8080)
         self.assertIn("test_miner", self.manager.list_miners())
+        self.manager.edit_miner("test_miner", {"miner_name": "new_miner"})
+        self.assertEqual(self.manager.list_miners(), ("new_miner",))
+        self.manager.remove_miner("new_miner")
+        self.assertEqual(self.manager.list_miners(), ())
 
 if __name__ == '__main__':
     unittest.main()
@@ -24,19 +24,25 @@ Classes:
 Modules:
 
 - api: Contains the XMRigAPI class and related functionalities.
-- manager: Contains the XMRigManager class for managing multiple miners.
+- manager: Contains the XMRigManager class for managing multiple miners and the shared default_manager.
 - exceptions: Handles custom exceptions.
 - models: Contains the Summary, Config and Backend ORM models.
 - db: Contains the XMRigDatabase class for database operations.
+- logger: Contains the logging_setup helper for configuring logging.
 
 Public Functions:
 
 XMRigAPI:
 
+- close: Closes the pooled connections and background refresh thread of a miner.
 - set_auth_header: Sets the authorization header for API requests.
+- set_ttl: Sets how long cached endpoint data is considered fresh.
 - get_endpoint: Fetches data from a specified API endpoint.
 - post_config: Posts configuration data to the API.
+- patch_config: Updates a single value in the configuration data via the API.
 - get_all_responses: Retrieves all responses from the API.
+- refresh: Fetches all responses from the API, even if the cached data is fresh.
+- get_all_responses_async: Retrieves all responses from the API concurrently.
 - perform_action: Executes a specified action on the miner.
 
 XMRigManager:
@@ -47,13 +53,21 @@ XMRigManager:
 - edit_miner: Edits the configuration of an existing miner.
 - perform_action_on_all: Executes a specified action on all managed miners.
 - update_miners: Updates the status of all managed miners.
+- update_miners_async: Updates the status of all managed miners concurrently within an asyncio event loop.
+- fleet_hashrate: Totals the hashrate of all managed miners.
 - list_miners: Lists all managed miners.
+- close: Closes all managed miners and stops the manager's thread pool.
+
+default_manager: Returns a process-wide XMRigManager instance, creating it on first use.
+
+logging_setup: Configures logging to a file and the console once and returns the requested logger.
 
 XMRigDatabase:
 
 - _init_db: Initializes the database.
 - _get_db_session: Retrieves the database connection.
 - _insert_data_to_db: Inserts data into the database.
+- _insert_many_to_db: Inserts data from several endpoints into the database in a single transaction.
 - _delete_all_miner_data_from_db: Deletes all miner-related data from the database.
 
 XMRigProperties:
@@ -336,6 +350,7 @@ XMRigDatabase:
 - _init_db: Initializes the database.
 - _get_db_session: Retrieves the database connection.
 - _insert_data_to_db: Inserts data into the database.
+- _insert_many_to_db: Inserts data from several endpoints into the database in a single transaction.
 - _insert_summary_data: Inserts summary data into the database.
 - _insert_config_data: Inserts configuration data into the database.
 - _insert_backend_data: Inserts backend data into the database.
@@ -352,10 +367,11 @@ Exceptions:
 """
 
 from .api import XMRigAPI
-from .manager import XMRigManager
+from .manager import XMRigManager, default_manager
 from .db import XMRigDatabase
 from .exceptions import XMRigAPIError, XMRigAuthorizationError, XMRigConnectionError, XMRigDatabaseError, XMRigManagerError
 from .models import Summary, Config, Backends
+from .logger import logging_setup
 
 __name__ = "xmrig"
 __version__ = "0.2.7"
@@ -365,4 +381,4 @@ __license__ = "MIT"
 __description__ = "This module provides objects to interact with the XMRig miner API, manage multiple miners, and store collected data in a database."
 __url__ = "https://hreikin.co.uk/xmrig-api"
 
-__all__ = ["XMRigAPI", "XMRigAPIError", "XMRigAuthorizationError", "XMRigConnectionError", "XMRigDatabase", "XMRigDatabaseError", "XMRigManager", "XMRigManagerError", "Summary", "Config", "Backends"]
\ No newline at end of file
+__all__ = ["XMRigAPI", "XMRigAPIError", "XMRigAuthorizationError", "XMRigConnectionError", "XMRigDatabase", "XMRigDatabaseError", "XMRigManager", "XMRigManagerError", "default_manager", "Summary", "Config", "Backends", "logging_setup"]
\ No newline at end of file
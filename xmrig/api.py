@@ -17,45 +17,143 @@ It includes functionalities for:
 # TODO: Create example for accessing database data
 # TODO: Use a default db_url value of "sqlite:///xmrig-api.db" in the constructor, refactor the code to use this default value instead of checking for None
 
-import requests, traceback, logging
+import requests, logging, asyncio, time, functools, copy
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from xmrig.exceptions import XMRigAPIError, XMRigAuthorizationError, XMRigConnectionError, XMRigDatabaseError
 from xmrig.db import XMRigDatabase
-from datetime import timedelta
+from datetime import datetime, timedelta
 from json import JSONDecodeError
 
+try:
+    # Parse and serialize straight from/to bytes with orjson if it is installed, it is several times faster than json
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    from json import loads as json_loads, dumps as _dumps
+
+    def json_dumps(obj):
+        return _dumps(obj).encode()
+
 log = logging.getLogger("xmrig.api")
 
+# Default for arguments where None is a meaningful value, e.g. removing the access token
+_UNSET = object()
+
+def _memoized(endpoint):
+    """
+    Decorator which memoizes a property getter until the cached data for the endpoint is next updated.
+
+    Memoized results are shared between callers and should be treated as read-only. Values read while the
+    endpoint has no cached response come from the database fallback and are not memoized.
+
+    Args:
+        endpoint (str): The endpoint whose cached data the property is derived from.
+
+    Returns:
+        callable: The decorator to apply beneath `@property`.
+    """
+    def decorator(func):
+        name = func.__name__
+        @functools.wraps(func)
+        def wrapper(self):
+            try:
+                return self._property_memo[endpoint][name]
+            except KeyError:
+                self._fetch_on_first_read(endpoint)
+                # Read the memo again as a fetch replaces it
+                memo = self._property_memo[endpoint]
+                cached = getattr(self, f"_{endpoint}_cache")
+                result = func(self)
+                if cached is not None:
+                    memo[name] = result
+                return result
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=None)
+def _path_getter(keys):
+    """
+    Builds a function which looks up a fixed path of keys in response data.
+
+    The lookups are generated as a single chain of subscripts (e.g. `response[0]["threads"]`) and compiled 
+    once per path, avoiding a loop over the keys on every property read.
+
+    Args:
+        keys (tuple): The keys to look up, in order. Each key must be a string or an integer.
+
+    Returns:
+        callable: Function accepting the response data and returning the value at the path.
+    """
+    subscripts = "".join(f"[{key!r}]" for key in keys)
+    namespace = {}
+    exec(compile(f"def getter(response):\n    return response{subscripts}\n", f"<xmrig path {keys!r}>", "exec"), namespace)
+    return namespace["getter"]
+
 class XMRigAPI:
     """
     A class to interact with the XMRig miner API.
 
+    Properties return None when their data is not available from the cache or the database. Lists and
+    dictionaries returned by properties are shared between reads and should not be modified.
+
     Attributes:
         _miner_name (str): Unique name for the miner.
         _ip (str): IP address of the XMRig API.
         _port (int): Port of the XMRig API.
         _access_token (str): Access token for authorization.
+        _timeout (float | tuple): Connect and read timeout in seconds for every request.
         _base_url (str): Base URL for the XMRig API.
         _json_rpc_url (str): URL for the JSON RPC.
         _summary_url (str): URL for the summary endpoint.
         _backends_url (str): URL for the backends endpoint.
         _config_url (str): URL for the config endpoint.
-        _headers (dict): Headers for all API/RPC requests.
-        _json_rpc_payload (dict): Default payload to send with RPC request.
+        _endpoint_urls (dict): URL for each endpoint, keyed by endpoint name.
+        _session (requests.Session): Session reusing pooled keep-alive connections for all API/RPC requests.
+        _headers (dict): Headers for all API/RPC requests, shared with the session.
         _summary_cache (dict): Cached summary endpoint data.
         _backends_cache (list): Cached backends endpoint data.
         _config_cache (dict): Cached config endpoint data.
         _summary_table_name (str): Table name for summary data.
         _backends_table_name (str): Table name for backends data.
         _config_table_name (str): Table name for config data.
+        _cache_ttl (dict): Number of seconds each endpoint's cached data is considered fresh.
+        _cache_fetched_at (dict): Monotonic time each endpoint was last fetched, or None if it needs fetching.
+        _refresh_pool (ThreadPoolExecutor): Executor used to refresh stale cached data in the background.
+        _fetch_pool (ThreadPoolExecutor): Executor used to fetch the endpoints concurrently in `get_all_responses`.
+        _refresh_futures (dict): Pending background refresh for each endpoint.
+        _lazy_fetched (set): Endpoints already fetched (or attempted) because a property was read before any data was available.
+        _property_memo (dict): Memoized property results for each endpoint, reset when its cached data is updated.
     """
 
-    def __init__(self, miner_name, ip, port, access_token = None, tls_enabled = False, db_url = None):
+    __slots__ = (
+        "_miner_name", "_ip", "_port", "_access_token", "_tls_enabled", "_db_url", "_timeout",
+        "_base_url", "_json_rpc_url", "_summary_url", "_backends_url", "_config_url", "_endpoint_urls",
+        "_session", "_headers",
+        "_summary_cache", "_backends_cache", "_config_cache",
+        "_cache_ttl", "_cache_fetched_at", "_refresh_pool", "_fetch_pool", "_refresh_futures", "_lazy_fetched",
+        "_property_memo",
+    )
+
+    # The database table names are the same for every miner, so they are shared rather than stored per instance
+    _summary_table_name = "summary"
+    _backends_table_name = "backends"
+    _config_table_name = "config"
+
+    def __init__(self, miner_name, ip, port, access_token = None, tls_enabled = False, db_url = None, timeout = (1.0, 3.0), cache_ttl = None):
         """
         Initializes the XMRig instance with the provided IP, port, and access token.
 
         The `ip` can be either an IP address or domain name with its TLD (e.g. `example.com`). The schema is not 
         required and the appropriate one will be chosen based on the `tls_enabled` value.
 
+        Nothing is fetched from the miner when the instance is created, each endpoint is fetched the first 
+        time one of its properties is read, or when `get_endpoint`, `get_all_responses` or `refresh` is called. 
+        If a database is configured, recently stored responses are loaded into the cache so a restarted 
+        program can start from them instead of waiting on the miner. Only responses stored within twice the 
+        endpoint's TTL are loaded, by default 4 seconds for summary and backends and 2 minutes for config, 
+        pass `cache_ttl` to widen the window.
+
         Args:
             miner_name (str): A unique name for the miner.
             ip (str): IP address or domain of the XMRig API.
@@ -63,39 +161,118 @@ class XMRigAPI:
             access_token (str, optional): Access token for authorization. Defaults to None.
             tls_enabled (bool, optional): TLS status of the miner/API. Defaults to False.
             db_url (str, optional): Database URL for storing miner data. Defaults to None.
+            timeout (float | tuple, optional): Connect and read timeout in seconds for every request, a single value is used for both. Defaults to (1.0, 3.0).
+            cache_ttl (dict, optional): Number of seconds each endpoint's cached data is fresh for, keyed by endpoint name. Defaults to None for 2 seconds for summary and backends and 60 seconds for config.
         """
         self._miner_name = miner_name
         self._ip = ip
         self._port = port
         self._access_token = access_token
         self._tls_enabled = tls_enabled
-        self._base_url = f"https://{ip}:{port}" if self._tls_enabled else f"http://{ip}:{port}"
         self._db_url = db_url
-        self._json_rpc_url = f"{self._base_url}/json_rpc"
-        self._summary_url = f"{self._base_url}/2/summary"
-        self._backends_url = f"{self._base_url}/2/backends"
-        self._config_url = f"{self._base_url}/2/config"
+        self._timeout = timeout
+        self._set_urls()
         self._summary_cache = None
         self._backends_cache = None
         self._config_cache = None
-        self._summary_table_name = "summary"
-        self._backends_table_name = "backends"
-        self._config_table_name = "config"
-        self._headers = {
+        self._cache_ttl = {"summary": 2, "backends": 2, "config": 60}
+        for endpoint, seconds in (cache_ttl or {}).items():
+            self.set_ttl(seconds, endpoint)
+        self._cache_fetched_at = {"summary": None, "backends": None, "config": None}
+        self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"xmrig-{miner_name}")
+        self._fetch_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix=f"xmrig-{miner_name}-fetch")
+        self._refresh_futures = {}
+        self._lazy_fetched = set()
+        self._property_memo = {"summary": {}, "backends": {}, "config": {}}
+        self._session = requests.Session()
+        # Every request goes to the same host, keep enough connections for the concurrent fetches plus a refresh.
+        # Only a failed connection is retried, once and straight away, so an unresponsive miner fails fast.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=1, connect=1, read=0, backoff_factor=0))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
-            "Host": f"{self._base_url}",
             "Connection": "keep-alive",
-            "Authorization": f"Bearer {self._access_token}"
-        }
-        self._json_rpc_payload = {
-            "method": None,
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-        self.get_all_responses()
+        })
+        self._headers = self._session.headers
+        self.set_auth_header()
+        if self._db_url is not None:
+            self._load_cache_from_db()
         log.info(f"XMRigAPI initialized for {self._base_url}")
     
+    def _set_urls(self):
+        """
+        Builds the base, JSON RPC and endpoint URLs from the current IP, port and TLS status.
+
+        The URLs are built once here rather than on every request, this must be called again whenever the 
+        IP, port or TLS status of the miner changes.
+        """
+        self._base_url = f"https://{self._ip}:{self._port}" if self._tls_enabled else f"http://{self._ip}:{self._port}"
+        self._json_rpc_url = f"{self._base_url}/json_rpc"
+        self._summary_url = f"{self._base_url}/2/summary"
+        self._backends_url = f"{self._base_url}/2/backends"
+        self._config_url = f"{self._base_url}/2/config"
+        self._endpoint_urls = {
+            "summary": self._summary_url,
+            "backends": self._backends_url,
+            "config": self._config_url
+        }
+
+    def _clear_cache(self):
+        """
+        Discards the cached data, fetch times and memoized properties for every endpoint.
+
+        Called when the miner's address changes, so data from the old address is not served as fresh.
+        """
+        for endpoint in self._cache_fetched_at:
+            setattr(self, f"_{endpoint}_cache", None)
+            self._cache_fetched_at[endpoint] = None
+            self._property_memo[endpoint] = {}
+        self._lazy_fetched.clear()
+
+    def _load_cache_from_db(self):
+        """
+        Populates the cache from the most recent database entry for each endpoint.
+
+        Endpoints loaded while still fresh are not fetched again until their TTL passes, stale ones are served 
+        while they are refreshed as usual. Entries older than twice the endpoint's TTL are ignored as they 
+        would be fetched again immediately, so with the default TTLs only summary and backends data stored in 
+        the last 4 seconds and config data stored in the last 2 minutes is used. Database errors are logged 
+        rather than raised, the endpoints are then fetched from the miner instead.
+        """
+        for endpoint in self._cache_fetched_at:
+            try:
+                result = XMRigDatabase.retrieve_data_from_db(self._db_url, endpoint, self._miner_name, ["full_json", "timestamp"])
+            except XMRigDatabaseError as e:
+                log.error(f"An error occurred loading the cached {endpoint} data from the database: {e}")
+                continue
+            if not result:
+                continue
+            age = (datetime.now() - result[0]["timestamp"]).total_seconds()
+            if 0 <= age < self._cache_ttl[endpoint] * 2:
+                self._update_cache(result[0]["full_json"], endpoint)
+                self._cache_fetched_at[endpoint] = time.monotonic() - age
+                log.debug(f"{endpoint.capitalize()} endpoint loaded from the database.")
+
+    def _fetch_on_first_read(self, endpoint):
+        """
+        Fetches the endpoint if a property is read before any of its data is available.
+
+        This is only attempted once per endpoint, errors are logged rather than raised and the property then 
+        falls back to the database or None as usual.
+
+        Args:
+            endpoint (str): The endpoint the property reads from.
+        """
+        if endpoint in self._lazy_fetched or getattr(self, f"_{endpoint}_cache") is not None:
+            return
+        self._lazy_fetched.add(endpoint)
+        try:
+            self.get_endpoint(endpoint)
+        except XMRigAPIError as e:
+            log.error(f"An error occurred fetching the {endpoint} endpoint on first read: {e}")
+
     def _update_cache(self, response, endpoint):
         """
         Updates the cached data for an endpoint with the supplied response data.
@@ -104,12 +281,10 @@ class XMRigAPI:
             response (dict | list): The response data.
             endpoint (str): The endpoint from which the data is retrieved.
         """
-        if endpoint == "summary":
-            self._summary_cache = response
-        if endpoint == "backends":
-            self._backends_cache = response
-        if endpoint == "config":
-            self._config_cache = response
+        setattr(self, f"_{endpoint}_cache", response)
+        # Replace the memo only after the new data is in place, so a property read on another thread in 
+        # between cannot memoize values from the old data into the new memo
+        self._property_memo[endpoint] = {}
     
     def _get_data_from_cache(self, response, keys, table_name, selection):
         """
@@ -117,39 +292,25 @@ class XMRigAPI:
 
         Args:
             response (dict | list): The response data.
-            keys (list): The keys to use to retrieve the data.
+            keys (tuple): The keys to use to retrieve the data.
             table_name (str | list): The table name or list of table names to use for fallback database retrieval.
             selection (str): Column to select from the table.
 
         Returns:
-            Any: The retrieved data, or a default string value of "N/A" if not available.
-
-        Raises:
-            JSONDecodeError: If there is an error decoding the JSON response.
-            KeyError: If a key is not found in the response data.
-            XMRigDatabaseError: If there is an error retrieving data from the database.
+            Any: The retrieved data, or None if not available.
         """
-        data = "N/A"
-        try:
-            if response == None:
-                # TODO: Use this exception or requests.exceptions.JSONDecodeError ?
-                raise JSONDecodeError("No response data available, trying database.", "", 0)
-            else:
-                data = response
-                if len(keys) > 0:
-                    for key in keys:
-                        data = data[key]
-        except JSONDecodeError as e:
+        if response is None:
             if self._db_url is not None:
                 try:
                     return self._fallback_to_db(table_name, selection)
-                except XMRigDatabaseError as db_e:
-                    log.error(f"An error occurred fetching the backends data from the database: {db_e}")
-                    data = "N/A"
-        except KeyError as e:
+                except XMRigDatabaseError as e:
+                    log.error(f"An error occurred fetching the {table_name} data from the database: {e}")
+            return None
+        try:
+            return _path_getter(keys)(response)
+        except (KeyError, IndexError, TypeError) as e:
             log.error(f"Key not found in the response data: {e}")
-            data = "N/A"
-        return data
+            return None
     
     def _fallback_to_db(self, table_name, selection):
         """
@@ -161,10 +322,10 @@ class XMRigAPI:
             selection (str): Column to select from the table.
 
         Returns:
-            Any: The retrieved data, or a default string value of "N/A" if not available.
+            Any: The retrieved data, or None if not available.
         """
         result = XMRigDatabase.retrieve_data_from_db(self._db_url, table_name, self._miner_name, selection)
-        return result[0].get(selection, "N/A") if len(result) > 0 else "N/A"
+        return result[0].get(selection) if result else None
     
     def get_from_db(self, table_name, selection):
         """
@@ -179,10 +340,24 @@ class XMRigAPI:
         """
         return XMRigDatabase.retrieve_data_from_db(self._db_url, table_name, self._miner_name, selection)
     
-    def set_auth_header(self):
+    def close(self):
+        """
+        Closes the session's pooled connections and stops the background refresh and fetch threads.
+
+        The instance should not be used after it has been closed.
+        """
+        self._refresh_pool.shutdown(wait=False)
+        self._fetch_pool.shutdown(wait=False)
+        self._session.close()
+        log.debug(f"XMRigAPI for {self._base_url} closed.")
+
+    def set_auth_header(self, access_token = _UNSET):
         """
         Update the Authorization header for the HTTP requests.
 
+        Args:
+            access_token (str, optional): New access token for authorization, or None to remove the current access token. Defaults to reusing the current access token.
+
         Returns:
             bool: True if the Authorization header was changed, or False if an error occurred.
         
@@ -190,18 +365,52 @@ class XMRigAPI:
             XMRigAuthorizationError: An error occurred setting the Authorization Header.
         """
         try:
-            self._headers["Authorization"] = f"Bearer {self._access_token}"
+            if access_token is not _UNSET:
+                self._access_token = access_token
+            # Miners without an access token don't need the header, rather than sending "Bearer None"
+            if self._access_token is None:
+                self._headers.pop("Authorization", None)
+            else:
+                self._headers["Authorization"] = f"Bearer {self._access_token}"
             log.debug(f"Authorization header successfully changed.")
             return True
         except XMRigAuthorizationError as e:
-            raise XMRigAuthorizationError(e, traceback.format_exc(), f"An error occurred setting the Authorization Header: {e}") from e
+            raise XMRigAuthorizationError(e, message = f"An error occurred setting the Authorization Header: {e}") from e
+
+    def set_ttl(self, seconds, endpoint = None):
+        """
+        Sets how long cached data is considered fresh before it is fetched again.
+
+        Args:
+            seconds (float): Number of seconds the cached data is fresh for, 0 fetches on every request.
+            endpoint (str, optional): The endpoint to set the TTL for. Defaults to None for all endpoints.
+
+        Raises:
+            XMRigAPIError: If the TTL is negative or the endpoint is unknown.
+        """
+        try:
+            if seconds < 0:
+                raise ValueError(f"TTL must not be negative, got {seconds}.")
+            endpoints = self._cache_ttl.keys() if endpoint is None else [endpoint]
+            for name in endpoints:
+                if name not in self._cache_ttl:
+                    raise KeyError(name)
+                self._cache_ttl[name] = seconds
+            log.debug(f"Cache TTL set to {seconds} seconds for {'all endpoints' if endpoint is None else endpoint}.")
+        except Exception as e:
+            raise XMRigAPIError(e, message = f"An error occurred setting the cache TTL:") from e
 
-    def get_endpoint(self, endpoint):
+    def get_endpoint(self, endpoint, force_refresh = False):
         """
         Updates the cached data from the specified XMRig API endpoint.
 
+        Cached data younger than the endpoint's TTL is returned without contacting the miner. Once the TTL 
+        has passed the cached data is still served for up to one further TTL while it is refreshed in the 
+        background (stale-while-revalidate), after that the endpoint is fetched before returning.
+
         Args:
             endpoint (str): The endpoint to fetch data from. Should be one of 'summary', 'backends', or 'config'.
+            force_refresh (bool, optional): Fetch the endpoint even if the cached data is fresh. Defaults to False.
 
         Returns:
             bool: True if the cached data is successfully updated or False if an error occurred.
@@ -211,25 +420,111 @@ class XMRigAPI:
             XMRigConnectionError: If a connection error occurs.
             XMRigAPIError: If a general API error occurs.
         """
-        url_map = {
-            "summary": self._summary_url,
-            "backends": self._backends_url,
-            "config": self._config_url
-        }
+        return self._get_endpoint_cached(endpoint, force_refresh = force_refresh)
+
+    def _get_endpoint_cached(self, endpoint, pending_writes = None, force_refresh = False):
+        """
+        Updates the cached data for the endpoint if its TTL has passed.
+
+        Args:
+            endpoint (str): The endpoint to fetch data from. Should be one of 'summary', 'backends', or 'config'.
+            pending_writes (list, optional): List to collect the fetched data in for a later database write. Defaults to None to write it immediately.
+            force_refresh (bool, optional): Fetch the endpoint even if the cached data is fresh. Defaults to False.
+
+        Returns:
+            bool: True if the cached data is successfully updated or False if an error occurred.
+
+        Raises:
+            XMRigAuthorizationError: If an authorization error occurs.
+            XMRigConnectionError: If a connection error occurs.
+            XMRigAPIError: If a general API error occurs.
+        """
+        fetched_at = self._cache_fetched_at.get(endpoint)
+        if fetched_at is not None and not force_refresh:
+            age = time.monotonic() - fetched_at
+            ttl = self._cache_ttl[endpoint]
+            if age < ttl:
+                log.debug(f"{endpoint.capitalize()} endpoint served from cache.")
+                return True
+            if age < ttl * 2:
+                self._schedule_refresh(endpoint)
+                log.debug(f"{endpoint.capitalize()} endpoint served from stale cache, refreshing in the background.")
+                return True
+        return self._fetch_endpoint(endpoint, pending_writes)
+
+    def _schedule_refresh(self, endpoint):
+        """
+        Submits a background refresh for the endpoint unless one is already pending.
+
+        Args:
+            endpoint (str): The endpoint to refresh.
+        """
+        future = self._refresh_futures.get(endpoint)
+        if future is None or future.done():
+            self._refresh_futures[endpoint] = self._refresh_pool.submit(self._background_refresh, endpoint)
+
+    def _background_refresh(self, endpoint):
+        """
+        Refreshes the endpoint, logging rather than raising any errors as there is no caller to handle them.
+
+        Args:
+            endpoint (str): The endpoint to refresh.
+        """
         try:
-            response = requests.get(url_map[endpoint], headers=self._headers)
-            if response.status_code == 401:
+            self._fetch_endpoint(endpoint)
+        except XMRigAPIError as e:
+            log.error(f"An error occurred refreshing the {endpoint} endpoint in the background: {e}")
+
+    def _http_get(self, url):
+        """
+        Sends a GET request through the session, this is the only place responses are read from the miner.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            tuple: The response status code and the raw response body.
+
+        Raises:
+            requests.exceptions.RequestException: If the request could not be completed.
+        """
+        response = self._session.get(url, timeout=self._timeout)
+        return response.status_code, response.content
+
+    def _fetch_endpoint(self, endpoint, pending_writes = None):
+        """
+        Fetches the specified XMRig API endpoint and updates the cached data.
+
+        Args:
+            endpoint (str): The endpoint to fetch data from. Should be one of 'summary', 'backends', or 'config'.
+            pending_writes (list, optional): List to collect the fetched data in for a later database write. Defaults to None to write it immediately.
+
+        Returns:
+            bool: True if the cached data is successfully updated or False if an error occurred.
+
+        Raises:
+            XMRigAuthorizationError: If an authorization error occurs.
+            XMRigConnectionError: If a connection error occurs.
+            XMRigAPIError: If a general API error occurs.
+        """
+        url = self._endpoint_urls[endpoint]
+        try:
+            status_code, content = self._http_get(url)
+            if status_code == 401:
                 raise XMRigAuthorizationError(message = "401 UNAUTHORIZED")
-            response.raise_for_status()
+            if status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{status_code} Error for url: {url}")
             try:
-                json_response = response.json()
-            except requests.exceptions.JSONDecodeError as e:
-                json_response = None
-                raise requests.exceptions.JSONDecodeError("JSON decode error", response.text, response.status_code)
+                json_response = json_loads(content)
+            except (JSONDecodeError, UnicodeDecodeError):
+                raise requests.exceptions.JSONDecodeError("JSON decode error", content.decode(errors = "replace"), status_code)
             else:
                 self._update_cache(json_response, endpoint)
+                self._cache_fetched_at[endpoint] = time.monotonic()
                 log.debug(f"{endpoint.capitalize()} endpoint successfully fetched.")
-                if self._db_url is not None:
+                if pending_writes is not None:
+                    pending_writes.append((json_response, endpoint))
+                elif self._db_url is not None:
                     XMRigDatabase._insert_data_to_db(json_response, self._miner_name, endpoint, self._db_url)
                 return True
         except requests.exceptions.JSONDecodeError as e:
@@ -240,11 +535,11 @@ class XMRigAPI:
             log.error(f"An error occurred decoding the {endpoint} response: {e}")
             return False
         except requests.exceptions.RequestException as e:
-            raise XMRigConnectionError(e, traceback.format_exc(), f"An error occurred while connecting to {url_map[endpoint]}:") from e
+            raise XMRigConnectionError(e, message = f"An error occurred while connecting to {url}:") from e
         except XMRigAuthorizationError as e:
-            raise XMRigAuthorizationError(e, traceback.format_exc(), f"An authorization error occurred updating the {endpoint} endpoint, please provide a valid access token:") from e
+            raise XMRigAuthorizationError(e, message = f"An authorization error occurred updating the {endpoint} endpoint, please provide a valid access token:") from e
         except Exception as e:
-            raise XMRigAPIError(e, traceback.format_exc(), f"An error occurred updating the {endpoint} endpoint:") from e
+            raise XMRigAPIError(e, message = f"An error occurred updating the {endpoint} endpoint:") from e
 
     def post_config(self, config):
         """
@@ -262,28 +557,70 @@ class XMRigAPI:
             XMRigAPIError: If a general API error occurs.
         """
         try:
-            response = requests.post(self._config_url, json = config, headers = self._headers)
+            response = self._session.post(self._config_url, data = json_dumps(config), timeout=self._timeout)
             if response.status_code == 401:
                 raise XMRigAuthorizationError()
             # Raise an HTTPError for bad responses (4xx and 5xx)
             response.raise_for_status()
-            # Get the updated config data from the endpoint and update the cached data
+            # Invalidate and get the updated config data from the endpoint to update the cached data
+            self._cache_fetched_at["config"] = None
             self.get_endpoint("config")
             log.debug(f"Config endpoint successfully updated.")
             return True
         except requests.exceptions.JSONDecodeError as e:
             raise requests.exceptions.JSONDecodeError("JSON decode error", response.text, response.status_code)
         except requests.exceptions.RequestException as e:
-            raise XMRigConnectionError(e, traceback.format_exc(), f"An error occurred while connecting to {self._config_url}:") from e
+            raise XMRigConnectionError(e, message = f"An error occurred while connecting to {self._config_url}:") from e
         except XMRigAuthorizationError as e:
-            raise XMRigAuthorizationError(e, traceback.format_exc(), f"An authorization error occurred posting the config, please provide a valid access token:") from e
+            raise XMRigAuthorizationError(e, message = f"An authorization error occurred posting the config, please provide a valid access token:") from e
+        except Exception as e:
+            raise XMRigAPIError(e, message = f"An error occurred posting the config:") from e
+
+    def patch_config(self, keys, value):
+        """
+        Updates a single value in the miners config data via the XMRig API.
+
+        Only the containers along the path of keys are copied, the rest of the cached config data is shared 
+        with the new config rather than deep copied, and the cached config data itself is left untouched until 
+        the updated config is fetched back from the miner.
+
+        Args:
+            keys (tuple): The keys leading to the value to update, e.g. `("api", "worker-id")` or `("pools", 0, "url")`.
+            value (Any): The new value.
+
+        Returns:
+            bool: True if the config was changed successfully, or False if an error occurred.
+
+        Raises:
+            XMRigAuthorizationError: If an authorization error occurs.
+            XMRigConnectionError: If a connection error occurs.
+            XMRigAPIError: If a general API error occurs.
+        """
+        self.get_endpoint("config")
+        try:
+            if self._config_cache is None:
+                raise ValueError("No config data available to update.")
+            config = node = copy.copy(self._config_cache)
+            for key in keys[:-1]:
+                node[key] = copy.copy(node[key])
+                node = node[key]
+            node[keys[-1]] = value
         except Exception as e:
-            raise XMRigAPIError(e, traceback.format_exc(), f"An error occurred posting the config:") from e
+            raise XMRigAPIError(e, message = f"An error occurred updating the config:") from e
+        return self.post_config(config)
 
-    def get_all_responses(self):
+    def get_all_responses(self, force_refresh = False):
         """
         Retrieves all responses from the API.
 
+        The endpoints which need fetching are requested at the same time from the instance's fetch threads 
+        over the session's pooled keep-alive connections, so the total wait is roughly one round trip rather 
+        than three. Once every fetch has finished the fetched data is stored in the database in a single 
+        transaction, including when one of the endpoints failed, before the first error is raised.
+
+        Args:
+            force_refresh (bool, optional): Fetch every endpoint even if its cached data is fresh. Defaults to False.
+
         Returns:
             bool: True if successful, or False if an error occurred.
 
@@ -292,10 +629,49 @@ class XMRigAPI:
             XMRigConnectionError: If a connection error occurs.
             XMRigAPIError: If a general API error occurs.
         """
-        summary_success = self.get_endpoint("summary")
-        backends_success = self.get_endpoint("backends")
-        config_success = self.get_endpoint("config")
-        return summary_success and backends_success and config_success
+        endpoints = ("summary", "backends", "config")
+        pending_writes = [] if self._db_url is not None else None
+        futures = [self._fetch_pool.submit(self._get_endpoint_cached, endpoint, pending_writes, force_refresh) for endpoint in endpoints]
+        # Wait for every fetch so whatever was fetched is stored, even if one of the endpoints failed
+        wait(futures)
+        if pending_writes:
+            try:
+                XMRigDatabase._insert_many_to_db(pending_writes, self._miner_name, self._db_url)
+            except XMRigDatabaseError as e:
+                raise XMRigAPIError(e, message = f"An error occurred storing the responses in the database:") from e
+        return all([future.result() for future in futures])
+
+    def refresh(self):
+        """
+        Fetches all endpoints from the miner, even if their cached data is still fresh.
+
+        Returns:
+            bool: True if successful, or False if an error occurred.
+
+        Raises:
+            XMRigAuthorizationError: If an authorization error occurs.
+            XMRigConnectionError: If a connection error occurs.
+            XMRigAPIError: If a general API error occurs.
+        """
+        return self.get_all_responses(force_refresh = True)
+
+    async def get_all_responses_async(self):
+        """
+        Retrieves all responses from the API concurrently.
+
+        Runs `get_all_responses` in the event loop's default executor, so the endpoints are fetched 
+        concurrently and stored in the database in a single transaction without blocking the event loop.
+
+        Returns:
+            bool: True if successful, or False if an error occurred.
+
+        Raises:
+            XMRigAuthorizationError: If an authorization error occurs.
+            XMRigConnectionError: If a connection error occurs.
+            XMRigAPIError: If a general API error occurs.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_all_responses)
 
     def perform_action(self, action):
         """
@@ -322,3080 +698,3334 @@ class XMRigAPI:
                 self.post_config(self._config_cache)
                 log.debug(f"Miner successfully started.")
             else:
-                url = f"{self._json_rpc_url}"
-                payload = self._json_rpc_payload
-                payload["method"] = action
-                response = requests.post(url, json=payload, headers=self._headers)
+                payload = {"method": action, "jsonrpc": "2.0", "id": 1}
+                response = self._session.post(self._json_rpc_url, data=json_dumps(payload), timeout=self._timeout)
                 response.raise_for_status()
                 log.debug(f"Miner successfully {action}ed.")
             return True
         except requests.exceptions.RequestException as e:
-            raise XMRigConnectionError(e, traceback.format_exc(), f"A connection error occurred {action}ing the miner:") from e
+            raise XMRigConnectionError(e, message = f"A connection error occurred {action}ing the miner:") from e
         except Exception as e:
-            raise XMRigAPIError(e, traceback.format_exc(), f"An error occurred {action}ing the miner:") from e
+            raise XMRigAPIError(e, message = f"An error occurred {action}ing the miner:") from e
     
     ############################
     # Full data from endpoints #
     ############################
 
     @property
+    @_memoized("summary")
     def summary(self):
         """
         Retrieves the entire cached summary endpoint data.
 
         Returns:
-            dict: Current summary response, or "N/A" if not available.
+            dict: Current summary response, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, [], self._summary_table_name, "full_json")
+        return self._get_data_from_cache(self._summary_cache, (), self._summary_table_name, "full_json")
 
     @property
+    @_memoized("backends")
     def backends(self):
         """
         Retrieves the entire cached backends endpoint data.
 
         Returns:
-            list: Current backends response, or "N/A" if not available.
+            list: Current backends response, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [], self._backends_table_name, "full_json")
+        return self._get_data_from_cache(self._backends_cache, (), self._backends_table_name, "full_json")
 
     @property
+    @_memoized("config")
     def config(self):
         """
         Retrieves the entire cached config endpoint data.
 
         Returns:
-            dict: Current config response, or "N/A" if not available.
+            dict: Current config response, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, [], self._config_table_name, "full_json")
+        return self._get_data_from_cache(self._config_cache, (), self._config_table_name, "full_json")
     
     ##############################
     # Data from summary endpoint #
     ##############################
 
     @property
+    @_memoized("summary")
     def sum_id(self):
         """
         Retrieves the cached ID information from the summary data.
 
         Returns:
-            str: ID information, or "N/A" if not available.
+            str: ID information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["id"], self._summary_table_name, "id")
+        return self._get_data_from_cache(self._summary_cache, ("id",), self._summary_table_name, "id")
 
     @property
+    @_memoized("summary")
     def sum_worker_id(self):
         """
         Retrieves the cached worker ID information from the summary data.
 
         Returns:
-            str: Worker ID information, or "N/A" if not available.
+            str: Worker ID information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["worker_id"], self._summary_table_name, "worker_id")
+        return self._get_data_from_cache(self._summary_cache, ("worker_id",), self._summary_table_name, "worker_id")
 
     @property
+    @_memoized("summary")
     def sum_uptime(self):
         """
         Retrieves the cached current uptime from the summary data.
 
         Returns:
-            int: Current uptime in seconds, or "N/A" if not available.
+            int: Current uptime in seconds, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["uptime"], self._summary_table_name, "uptime")
+        return self._get_data_from_cache(self._summary_cache, ("uptime",), self._summary_table_name, "uptime")
 
     @property
+    @_memoized("summary")
     def sum_uptime_readable(self):
         """
         Retrieves the cached uptime in a human-readable format from the summary data.
 
         Returns:
-            str: Uptime in the format "days, hours:minutes:seconds", or "N/A" if not available.
+            str: Uptime in the format "days, hours:minutes:seconds", or None if not available.
         """
-        result = self._get_data_from_cache(self._summary_cache, ["uptime"], self._summary_table_name, "uptime")
-        return str(timedelta(seconds=result)) if result != "N/A" else result
+        result = self._get_data_from_cache(self._summary_cache, ("uptime",), self._summary_table_name, "uptime")
+        return str(timedelta(seconds=result)) if result is not None else None
 
     @property
+    @_memoized("summary")
     def sum_restricted(self):
         """
         Retrieves the cached current restricted status from the summary data.
 
         Returns:
-            bool: Current restricted status, or "N/A" if not available.
+            bool: Current restricted status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["restricted"], self._summary_table_name, "restricted")
+        return self._get_data_from_cache(self._summary_cache, ("restricted",), self._summary_table_name, "restricted")
 
     @property
+    @_memoized("summary")
     def sum_resources(self):
         """
         Retrieves the cached resources information from the summary data.
 
         Returns:
-            dict: Resources information, or "N/A" if not available.
+            dict: Resources information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources"], self._summary_table_name, "full_json")
+        return self._get_data_from_cache(self._summary_cache, ("resources",), self._summary_table_name, "full_json")
 
     @property
+    @_memoized("summary")
     def sum_memory_usage(self):
         """
         Retrieves the cached memory usage from the summary data.
 
         Returns:
-            dict: Memory usage information, or "N/A" if not available.
+            dict: Memory usage information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "memory"], self._summary_table_name, "resources_memory")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "memory"), self._summary_table_name, "resources_memory")
 
     @property
+    @_memoized("summary")
     def sum_free_memory(self):
         """
         Retrieves the cached free memory from the summary data.
 
         Returns:
-            int: Free memory information, or "N/A" if not available.
+            int: Free memory information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "memory", "free"], self._summary_table_name, "resources_memory_free")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "memory", "free"), self._summary_table_name, "resources_memory_free")
 
     @property
+    @_memoized("summary")
     def sum_total_memory(self):
         """
         Retrieves the cached total memory from the summary data.
 
         Returns:
-            int: Total memory information, or "N/A" if not available.
+            int: Total memory information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "memory", "total"], self._summary_table_name, "resources_memory_total")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "memory", "total"), self._summary_table_name, "resources_memory_total")
 
     @property
+    @_memoized("summary")
     def sum_resident_set_memory(self):
         """
         Retrieves the cached resident set memory from the summary data.
 
         Returns:
-            int: Resident set memory information, or "N/A" if not available.
+            int: Resident set memory information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "memory", "resident_set_memory"], self._summary_table_name, "resources_memory_rsm")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "memory", "resident_set_memory"), self._summary_table_name, "resources_memory_rsm")
 
     @property
+    @_memoized("summary")
     def sum_load_average(self):
         """
         Retrieves the cached load average from the summary data.
 
         Returns:
-            list: Load average information, or "N/A" if not available.
+            list: Load average information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "load_average"], self._summary_table_name, "resources_load_average")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "load_average"), self._summary_table_name, "resources_load_average")
 
     @property
+    @_memoized("summary")
     def sum_hardware_concurrency(self):
         """
         Retrieves the cached hardware concurrency from the summary data.
 
         Returns:
-            int: Hardware concurrency information, or "N/A" if not available.
+            int: Hardware concurrency information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["resources", "hardware_concurrency"], self._summary_table_name, "resources_hardware_concurrency")
+        return self._get_data_from_cache(self._summary_cache, ("resources", "hardware_concurrency"), self._summary_table_name, "resources_hardware_concurrency")
 
     @property
+    @_memoized("summary")
     def sum_features(self):
         """
         Retrieves the cached supported features information from the summary data.
 
         Returns:
-            list: Supported features information, or "N/A" if not available.
+            list: Supported features information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["features"], self._summary_table_name, "features")
+        return self._get_data_from_cache(self._summary_cache, ("features",), self._summary_table_name, "features")
 
     @property
+    @_memoized("summary")
     def sum_results(self):
         """
         Retrieves the cached results information from the summary data.
 
         Returns:
-            dict: Results information, or "N/A" if not available.
+            dict: Results information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results"], self._summary_table_name, "results")
+        return self._get_data_from_cache(self._summary_cache, ("results",), self._summary_table_name, "results")
 
     @property
+    @_memoized("summary")
     def sum_current_difficulty(self):
         """
         Retrieves the cached current difficulty from the summary data.
 
         Returns:
-            int: Current difficulty, or "N/A" if not available.
+            int: Current difficulty, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "diff_current"], self._summary_table_name, "results_diff_current")
+        return self._get_data_from_cache(self._summary_cache, ("results", "diff_current"), self._summary_table_name, "results_diff_current")
 
     @property
+    @_memoized("summary")
     def sum_good_shares(self):
         """
         Retrieves the cached good shares from the summary data.
 
         Returns:
-            int: Good shares, or "N/A" if not available.
+            int: Good shares, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "shares_good"], self._summary_table_name, "results_shares_good")
+        return self._get_data_from_cache(self._summary_cache, ("results", "shares_good"), self._summary_table_name, "results_shares_good")
 
     @property
+    @_memoized("summary")
     def sum_total_shares(self):
         """
         Retrieves the cached total shares from the summary data.
 
         Returns:
-            int: Total shares, or "N/A" if not available.
+            int: Total shares, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "shares_total"], self._summary_table_name, "results_shares_total")
+        return self._get_data_from_cache(self._summary_cache, ("results", "shares_total"), self._summary_table_name, "results_shares_total")
 
     @property
+    @_memoized("summary")
     def sum_avg_time(self):
         """
         Retrieves the cached average time information from the summary data.
 
         Returns:
-            int: Average time information, or "N/A" if not available.
+            int: Average time information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "avg_time"], self._summary_table_name, "results_avg_time")
+        return self._get_data_from_cache(self._summary_cache, ("results", "avg_time"), self._summary_table_name, "results_avg_time")
 
     @property
+    @_memoized("summary")
     def sum_avg_time_ms(self):
         """
         Retrieves the cached average time in `ms` information from the summary data.
 
         Returns:
-            int: Average time in `ms` information, or "N/A" if not available.
+            int: Average time in `ms` information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "avg_time_ms"], self._summary_table_name, "results_avg_time_ms")
+        return self._get_data_from_cache(self._summary_cache, ("results", "avg_time_ms"), self._summary_table_name, "results_avg_time_ms")
 
     @property
+    @_memoized("summary")
     def sum_total_hashes(self):
         """
         Retrieves the cached total number of hashes from the summary data.
 
         Returns:
-            int: Total number of hashes, or "N/A" if not available.
+            int: Total number of hashes, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "hashes_total"], self._summary_table_name, "results_hashes_total")
+        return self._get_data_from_cache(self._summary_cache, ("results", "hashes_total"), self._summary_table_name, "results_hashes_total")
 
     @property
+    @_memoized("summary")
     def sum_best_results(self):
         """
         Retrieves the cached best results from the summary data.
 
         Returns:
-            list: Best results, or "N/A" if not available.
+            list: Best results, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["results", "best"], self._summary_table_name, "results_best")
+        return self._get_data_from_cache(self._summary_cache, ("results", "best"), self._summary_table_name, "results_best")
 
     @property
+    @_memoized("summary")
     def sum_algorithm(self):
         """
         Retrieves the cached current mining algorithm from the summary data.
 
         Returns:
-            str: Current mining algorithm, or "N/A" if not available.
+            str: Current mining algorithm, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["algo"], self._summary_table_name, "algo")
+        return self._get_data_from_cache(self._summary_cache, ("algo",), self._summary_table_name, "algo")
 
     @property
+    @_memoized("summary")
     def sum_connection(self):
         """
         Retrieves the cached connection information from the summary data.
 
         Returns:
-            dict: Connection information, or "N/A" if not available.
+            dict: Connection information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection"], self._summary_table_name, "connection")
+        return self._get_data_from_cache(self._summary_cache, ("connection",), self._summary_table_name, "connection")
 
     @property
+    @_memoized("summary")
     def sum_pool_info(self):
         """
         Retrieves the cached pool information from the summary data.
 
         Returns:
-            str: Pool information, or "N/A" if not available.
+            str: Pool information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "pool"], self._summary_table_name, "connection_pool")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "pool"), self._summary_table_name, "connection_pool")
 
     @property
+    @_memoized("summary")
     def sum_pool_ip_address(self):
         """
         Retrieves the cached IP address from the summary data.
 
         Returns:
-            str: IP address, or "N/A" if not available.
+            str: IP address, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "ip"], self._summary_table_name, "connection_ip")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "ip"), self._summary_table_name, "connection_ip")
 
     @property
+    @_memoized("summary")
     def sum_pool_uptime(self):
         """
         Retrieves the cached pool uptime information from the summary data.
 
         Returns:
-            int: Pool uptime information, or "N/A" if not available.
+            int: Pool uptime information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "uptime"], self._summary_table_name, "connection_uptime")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "uptime"), self._summary_table_name, "connection_uptime")
 
     @property
+    @_memoized("summary")
     def sum_pool_uptime_ms(self):
         """
         Retrieves the cached pool uptime in ms from the summary data.
 
         Returns:
-            int: Pool uptime in ms, or "N/A" if not available.
+            int: Pool uptime in ms, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "uptime_ms"], self._summary_table_name, "connection_uptime_ms")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "uptime_ms"), self._summary_table_name, "connection_uptime_ms")
 
     @property
+    @_memoized("summary")
     def sum_pool_ping(self):
         """
         Retrieves the cached pool ping information from the summary data.
 
         Returns:
-            int: Pool ping information, or "N/A" if not available.
+            int: Pool ping information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "ping"], self._summary_table_name, "connection_ping")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "ping"), self._summary_table_name, "connection_ping")
 
     @property
+    @_memoized("summary")
     def sum_pool_failures(self):
         """
         Retrieves the cached pool failures information from the summary data.
 
         Returns:
-            int: Pool failures information, or "N/A" if not available.
+            int: Pool failures information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "failures"], self._summary_table_name, "connection_failures")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "failures"), self._summary_table_name, "connection_failures")
 
     @property
+    @_memoized("summary")
     def sum_pool_tls(self):
         """
         Retrieves the cached pool tls status from the summary data.
 
         Returns:
-            bool: Pool tls status, or "N/A" if not available.
+            bool: Pool tls status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "tls"], self._summary_table_name, "connection_tls")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "tls"), self._summary_table_name, "connection_tls")
 
     @property
+    @_memoized("summary")
     def sum_pool_tls_fingerprint(self):
         """
         Retrieves the cached pool tls fingerprint information from the summary data.
 
         Returns:
-            str: Pool tls fingerprint information, or "N/A" if not available.
+            str: Pool tls fingerprint information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "tls-fingerprint"], self._summary_table_name, "connection_tls_fingerprint")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "tls-fingerprint"), self._summary_table_name, "connection_tls_fingerprint")
 
     @property
+    @_memoized("summary")
     def sum_pool_algo(self):
         """
         Retrieves the cached pool algorithm information from the summary data.
 
         Returns:
-            str: Pool algorithm information, or "N/A" if not available.
+            str: Pool algorithm information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "algo"], self._summary_table_name, "connection_algo")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "algo"), self._summary_table_name, "connection_algo")
 
     @property
+    @_memoized("summary")
     def sum_pool_diff(self):
         """
         Retrieves the cached pool difficulty information from the summary data.
 
         Returns:
-            int: Pool difficulty information, or "N/A" if not available.
+            int: Pool difficulty information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "diff"], self._summary_table_name, "connection_diff")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "diff"), self._summary_table_name, "connection_diff")
 
     @property
+    @_memoized("summary")
     def sum_pool_accepted_jobs(self):
         """
         Retrieves the cached number of accepted jobs from the summary data.
 
         Returns:
-            int: Number of accepted jobs, or "N/A" if not available.
+            int: Number of accepted jobs, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "accepted"], self._summary_table_name, "connection_accepted")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "accepted"), self._summary_table_name, "connection_accepted")
 
     @property
+    @_memoized("summary")
     def sum_pool_rejected_jobs(self):
         """
         Retrieves the cached number of rejected jobs from the summary data.
 
         Returns:
-            int: Number of rejected jobs, or "N/A" if not available.
+            int: Number of rejected jobs, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache,  ["connection", "rejected"], self._summary_table_name, "connection_rejected")
+        return self._get_data_from_cache(self._summary_cache,  ("connection", "rejected"), self._summary_table_name, "connection_rejected")
 
     @property
+    @_memoized("summary")
     def sum_pool_average_time(self):
         """
         Retrieves the cached pool average time information from the summary data.
 
         Returns:
-            int: Pool average time information, or "N/A" if not available.
+            int: Pool average time information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "avg_time"], self._summary_table_name, "connection_avg_time")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "avg_time"), self._summary_table_name, "connection_avg_time")
 
     @property
+    @_memoized("summary")
     def sum_pool_average_time_ms(self):
         """
         Retrieves the cached pool average time in ms from the summary data.
 
         Returns:
-            int: Pool average time in ms, or "N/A" if not available.
+            int: Pool average time in ms, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "avg_time_ms"], self._summary_table_name, "connection_avg_time_ms")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "avg_time_ms"), self._summary_table_name, "connection_avg_time_ms")
 
     @property
+    @_memoized("summary")
     def sum_pool_total_hashes(self):
         """
         Retrieves the cached pool total hashes information from the summary data.
 
         Returns:
-            int: Pool total hashes information, or "N/A" if not available.
+            int: Pool total hashes information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["connection", "hashes_total"], self._summary_table_name, "connection_hashes_total")
+        return self._get_data_from_cache(self._summary_cache, ("connection", "hashes_total"), self._summary_table_name, "connection_hashes_total")
 
     @property
+    @_memoized("summary")
     def sum_version(self):
         """
         Retrieves the cached version information from the summary data.
 
         Returns:
-            str: Version information, or "N/A" if not available.
+            str: Version information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["version"], self._summary_table_name, "version")
+        return self._get_data_from_cache(self._summary_cache, ("version",), self._summary_table_name, "version")
 
     @property
+    @_memoized("summary")
     def sum_kind(self):
         """
         Retrieves the cached kind information from the summary data.
 
         Returns:
-            str: Kind information, or "N/A" if not available.
+            str: Kind information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["kind"], self._summary_table_name, "kind")
+        return self._get_data_from_cache(self._summary_cache, ("kind",), self._summary_table_name, "kind")
 
     @property
+    @_memoized("summary")
     def sum_ua(self):
         """
         Retrieves the cached user agent information from the summary data.
 
         Returns:
-            str: User agent information, or "N/A" if not available.
+            str: User agent information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["ua"], self._summary_table_name, "ua")
+        return self._get_data_from_cache(self._summary_cache, ("ua",), self._summary_table_name, "ua")
 
     @property
+    @_memoized("summary")
     def sum_cpu_info(self):
         """
         Retrieves the cached CPU information from the summary data.
 
         Returns:
-            dict: CPU information, or "N/A" if not available.
+            dict: CPU information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu"], self._summary_table_name, "cpu")
+        return self._get_data_from_cache(self._summary_cache, ("cpu",), self._summary_table_name, "cpu")
 
     @property
+    @_memoized("summary")
     def sum_cpu_brand(self):
         """
         Retrieves the cached CPU brand information from the summary data.
 
         Returns:
-            str: CPU brand information, or "N/A" if not available.
+            str: CPU brand information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "brand"], self._summary_table_name, "cpu_brand")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "brand"), self._summary_table_name, "cpu_brand")
 
     @property
+    @_memoized("summary")
     def sum_cpu_family(self):
         """
         Retrieves the cached CPU family information from the summary data.
 
         Returns:
-            int: CPU family information, or "N/A" if not available.
+            int: CPU family information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "family"], self._summary_table_name, "cpu_family")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "family"), self._summary_table_name, "cpu_family")
 
     @property
+    @_memoized("summary")
     def sum_cpu_model(self):
         """
         Retrieves the cached CPU model information from the summary data.
 
         Returns:
-            int: CPU model information, or "N/A" if not available.
+            int: CPU model information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "model"], self._summary_table_name, "cpu_model")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "model"), self._summary_table_name, "cpu_model")
 
     @property
+    @_memoized("summary")
     def sum_cpu_stepping(self):
         """
         Retrieves the cached CPU stepping information from the summary data.
 
         Returns:
-            int: CPU stepping information, or "N/A" if not available.
+            int: CPU stepping information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache,  ["cpu", "stepping"], self._summary_table_name, "cpu_stepping")
+        return self._get_data_from_cache(self._summary_cache,  ("cpu", "stepping"), self._summary_table_name, "cpu_stepping")
 
     @property
+    @_memoized("summary")
     def sum_cpu_proc_info(self):
         """
         Retrieves the cached CPU frequency information from the summary data.
 
         Returns:
-            int: CPU frequency information, or "N/A" if not available.
+            int: CPU frequency information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "proc_info"], self._summary_table_name, "cpu_proc_info")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "proc_info"), self._summary_table_name, "cpu_proc_info")
 
     @property
+    @_memoized("summary")
     def sum_cpu_aes(self):
         """
         Retrieves the cached CPU AES support status from the summary data.
 
         Returns:
-            bool: CPU AES support status, or "N/A" if not available.
+            bool: CPU AES support status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "aes"], self._summary_table_name, "cpu_aes")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "aes"), self._summary_table_name, "cpu_aes")
 
     @property
+    @_memoized("summary")
     def sum_cpu_avx2(self):
         """
         Retrieves the cached CPU AVX2 support status from the summary data.
 
         Returns:
-            bool: CPU AVX2 support status, or "N/A" if not available.
+            bool: CPU AVX2 support status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "avx2"], self._summary_table_name, "cpu_avx2")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "avx2"), self._summary_table_name, "cpu_avx2")
 
     @property
+    @_memoized("summary")
     def sum_cpu_x64(self):
         """
         Retrieves the cached CPU x64 support status from the summary data.
 
         Returns:
-            bool: CPU x64 support status, or "N/A" if not available.
+            bool: CPU x64 support status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "x64"], self._summary_table_name, "cpu_x64")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "x64"), self._summary_table_name, "cpu_x64")
 
     @property
+    @_memoized("summary")
     def sum_cpu_64_bit(self):
         """
         Retrieves the cached CPU 64-bit support status from the summary data.
 
         Returns:
-            bool: CPU 64-bit support status, or "N/A" if not available.
+            bool: CPU 64-bit support status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "64_bit"], self._summary_table_name, "cpu_64_bit")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "64_bit"), self._summary_table_name, "cpu_64_bit")
 
     @property
+    @_memoized("summary")
     def sum_cpu_l2(self):
         """
         Retrieves the cached CPU L2 cache size from the summary data.
 
         Returns:
-            int: CPU L2 cache size, or "N/A" if not available.
+            int: CPU L2 cache size, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "l2"], self._summary_table_name, "cpu_l2")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "l2"), self._summary_table_name, "cpu_l2")
 
     @property
+    @_memoized("summary")
     def sum_cpu_l3(self):
         """
         Retrieves the cached CPU L3 cache size from the summary data.
 
         Returns:
-            int: CPU L3 cache size, or "N/A" if not available.
+            int: CPU L3 cache size, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "l3"], self._summary_table_name, "cpu_l3")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "l3"), self._summary_table_name, "cpu_l3")
 
     @property
+    @_memoized("summary")
     def sum_cpu_cores(self):
         """
         Retrieves the cached CPU cores count from the summary data.
 
         Returns:
-            int: CPU cores count, or "N/A" if not available.
+            int: CPU cores count, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "cores"], self._summary_table_name, "cpu_cores")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "cores"), self._summary_table_name, "cpu_cores")
 
     @property
+    @_memoized("summary")
     def sum_cpu_threads(self):
         """
         Retrieves the cached CPU threads count from the summary data.
 
         Returns:
-            int: CPU threads count, or "N/A" if not available.
+            int: CPU threads count, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "threads"], self._summary_table_name, "cpu_threads")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "threads"), self._summary_table_name, "cpu_threads")
 
     @property
+    @_memoized("summary")
     def sum_cpu_packages(self):
         """
         Retrieves the cached CPU packages count from the summary data.
 
         Returns:
-            int: CPU packages count, or "N/A" if not available.
+            int: CPU packages count, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "packages"], self._summary_table_name, "cpu_packages")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "packages"), self._summary_table_name, "cpu_packages")
 
     @property
+    @_memoized("summary")
     def sum_cpu_nodes(self):
         """
         Retrieves the cached CPU nodes count from the summary data.
 
         Returns:
-            int: CPU nodes count, or "N/A" if not available.
+            int: CPU nodes count, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "nodes"], self._summary_table_name, "cpu_nodes")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "nodes"), self._summary_table_name, "cpu_nodes")
 
     @property
+    @_memoized("summary")
     def sum_cpu_backend(self):
         """
         Retrieves the cached CPU backend information from the summary data.
 
         Returns:
-            str: CPU backend information, or "N/A" if not available.
+            str: CPU backend information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache,  ["cpu", "backend"], self._summary_table_name, "cpu_backend")
+        return self._get_data_from_cache(self._summary_cache,  ("cpu", "backend"), self._summary_table_name, "cpu_backend")
 
     @property
+    @_memoized("summary")
     def sum_cpu_msr(self):
         """
         Retrieves the cached CPU MSR information from the summary data.
 
         Returns:
-            str: CPU MSR information, or "N/A" if not available.
+            str: CPU MSR information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "msr"], self._summary_table_name, "cpu_msr")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "msr"), self._summary_table_name, "cpu_msr")
 
     @property
+    @_memoized("summary")
     def sum_cpu_assembly(self):
         """
         Retrieves the cached CPU assembly information from the summary data.
 
         Returns:
-            str: CPU assembly information, or "N/A" if not available.
+            str: CPU assembly information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache,  ["cpu", "assembly"], self._summary_table_name, "cpu_assembly")
+        return self._get_data_from_cache(self._summary_cache,  ("cpu", "assembly"), self._summary_table_name, "cpu_assembly")
 
     @property
+    @_memoized("summary")
     def sum_cpu_arch(self):
         """
         Retrieves the cached CPU architecture information from the summary data.
 
         Returns:
-            str: CPU architecture information, or "N/A" if not available.
+            str: CPU architecture information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "arch"], self._summary_table_name, "cpu_arch")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "arch"), self._summary_table_name, "cpu_arch")
 
     @property
+    @_memoized("summary")
     def sum_cpu_flags(self):
         """
         Retrieves the cached CPU flags information from the summary data.
 
         Returns:
-            list: CPU flags information, or "N/A" if not available.
+            list: CPU flags information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["cpu", "flags"], self._summary_table_name, "cpu_flags")
+        return self._get_data_from_cache(self._summary_cache, ("cpu", "flags"), self._summary_table_name, "cpu_flags")
 
     @property
+    @_memoized("summary")
     def sum_donate_level(self):
         """
         Retrieves the cached donate level information from the summary data.
 
         Returns:
-            int: Donate level information, or "N/A" if not available.
+            int: Donate level information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["donate_level"], self._summary_table_name, "donate_level")
+        return self._get_data_from_cache(self._summary_cache, ("donate_level",), self._summary_table_name, "donate_level")
 
     @property
+    @_memoized("summary")
     def sum_paused(self):
         """
         Retrieves the cached paused status from the summary data.
 
         Returns:
-            bool: Paused status, or "N/A" if not available.
+            bool: Paused status, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["paused"], self._summary_table_name, "paused")
+        return self._get_data_from_cache(self._summary_cache, ("paused",), self._summary_table_name, "paused")
 
     @property
+    @_memoized("summary")
     def sum_algorithms(self):
         """
         Retrieves the cached algorithms information from the summary data.
 
         Returns:
-            list: Algorithms information, or "N/A" if not available.
+            list: Algorithms information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["algorithms"], self._summary_table_name, "algorithms")
+        return self._get_data_from_cache(self._summary_cache, ("algorithms",), self._summary_table_name, "algorithms")
 
     @property
+    @_memoized("summary")
     def sum_hashrate(self):
         """
         Retrieves the cached hashrate information from the summary data.
 
         Returns:
-            dict: Hashrate information, or "N/A" if not available.
+            dict: Hashrate information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["hashrate"], self._summary_table_name, "hashrate")
+        return self._get_data_from_cache(self._summary_cache, ("hashrate",), self._summary_table_name, "hashrate")
     
     @property
+    @_memoized("summary")
     def sum_hashrate_total(self):
         """
         Retrieves the cached hashrate toal information from the summary data.
 
         Returns:
-            list: Hashrate total information, or "N/A" if not available.
+            list: Hashrate total information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["hashrate", "total"], self._summary_table_name, "hashrate_total")
+        return self._get_data_from_cache(self._summary_cache, ("hashrate", "total"), self._summary_table_name, "hashrate_total")
 
     @property
+    @_memoized("summary")
     def sum_hashrate_10s(self):
         """
         Retrieves the cached hashrate for the last 10 seconds from the summary data.
 
         Returns:
-            float: Hashrate for the last 10 seconds, or "N/A" if not available.
+            float: Hashrate for the last 10 seconds, or None if not available.
         """
-        result = self._get_data_from_cache(self._summary_cache, ["hashrate", "total"], self._summary_table_name, "hashrate_total")
-        return result[0] if result != "N/A" else result
+        result = self.sum_hashrate_total
+        return result[0] if isinstance(result, list) and len(result) > 0 else None
 
     @property
+    @_memoized("summary")
     def sum_hashrate_1m(self):
         """
         Retrieves the cached hashrate for the last 1 minute from the summary data.
 
         Returns:
-            float: Hashrate for the last 1 minute, or "N/A" if not available.
+            float: Hashrate for the last 1 minute, or None if not available.
         """
-        result = self._get_data_from_cache(self._summary_cache, ["hashrate", "total"], self._summary_table_name, "hashrate_total")
-        return result[1] if result != "N/A" else result
+        result = self.sum_hashrate_total
+        return result[1] if isinstance(result, list) and len(result) > 1 else None
 
     @property
+    @_memoized("summary")
     def sum_hashrate_15m(self):
         """
         Retrieves the cached hashrate for the last 15 minutes from the summary data.
 
         Returns:
-            float: Hashrate for the last 15 minutes, or "N/A" if not available.
+            float: Hashrate for the last 15 minutes, or None if not available.
         """
-        result = self._get_data_from_cache(self._summary_cache, ["hashrate", "total"], self._summary_table_name, "hashrate_total")
-        return result[2] if result != "N/A" else result
+        result = self.sum_hashrate_total
+        return result[2] if isinstance(result, list) and len(result) > 2 else None
 
     @property
+    @_memoized("summary")
     def sum_hashrate_highest(self):
         """
         Retrieves the cached highest hashrate from the summary data.
 
         Returns:
-            float: Highest hashrate, or "N/A" if not available.
+            float: Highest hashrate, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["hashrate", "highest"], self._summary_table_name, "hashrate_highest")
+        return self._get_data_from_cache(self._summary_cache, ("hashrate", "highest"), self._summary_table_name, "hashrate_highest")
 
     @property
+    @_memoized("summary")
     def sum_hugepages(self):
         """
         Retrieves the cached hugepages information from the summary data.
 
         Returns:
-            list: Hugepages information, or "N/A" if not available.
+            list: Hugepages information, or None if not available.
         """
-        return self._get_data_from_cache(self._summary_cache, ["hugepages"], self._summary_table_name, "hugepages")
+        return self._get_data_from_cache(self._summary_cache, ("hugepages",), self._summary_table_name, "hugepages")
 
     ###############################
     # Data from backends endpoint #
     ###############################
 
     @property
+    @_memoized("backends")
     def enabled_backends(self):
         """
         Retrieves the enabled backends from the backends data.
 
         Returns:
-            list: Enabled backends, or "N/A" if not available.
+            list: Enabled backends, or an empty list if not available.
         """
-        enabled_backends = []
-        if self._backends_cache and len(self._backends_cache) >= 1:
-            if self._get_data_from_cache(self._backends_cache, [0, "enabled"], self._backends_table_name, "cpu_enabled"):
-                enabled_backends.append(self._get_data_from_cache(self._backends_cache, [0, "type"], self._backends_table_name, "cpu_type"))
-        if self._backends_cache and len(self._backends_cache) >= 2:
-            if self._get_data_from_cache(self._backends_cache, [1, "enabled"], self._backends_table_name, "opencl_enabled"):
-                enabled_backends.append(self._get_data_from_cache(self._backends_cache, [1, "type"], self._backends_table_name, "opencl_type"))
-            if self._get_data_from_cache(self._backends_cache, [2, "enabled"], self._backends_table_name, "cuda_enabled"):
-                enabled_backends.append(self._get_data_from_cache(self._backends_cache, [2, "type"], self._backends_table_name, "cuda_type"))
-        return enabled_backends
+        backends = self._get_data_from_cache(self._backends_cache, (), self._backends_table_name, "full_json")
+        if not isinstance(backends, list):
+            return []
+        return [backend.get("type") for backend in backends if isinstance(backend, dict) and backend.get("enabled")]
 
     @property
+    @_memoized("backends")
     def be_cpu_type(self):
         """
         Retrieves the CPU backend type from the backends data.
 
         Returns:
-            str: CPU backend type, or "N/A" if not available.
+            str: CPU backend type, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "type"], self._backends_table_name, "cpu_type")
+        return self._get_data_from_cache(self._backends_cache, (0, "type"), self._backends_table_name, "cpu_type")
 
     @property
+    @_memoized("backends")
     def be_cpu_enabled(self):
         """
         Retrieves the CPU backend enabled status from the backends data.
 
         Returns:
-            bool: CPU backend enabled status, or "N/A" if not available.
+            bool: CPU backend enabled status, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "enabled"], self._backends_table_name, "cpu_enabled")
+        return self._get_data_from_cache(self._backends_cache, (0, "enabled"), self._backends_table_name, "cpu_enabled")
 
     @property
+    @_memoized("backends")
     def be_cpu_algo(self):
         """
         Retrieves the CPU backend algorithm from the backends data.
 
         Returns:
-            str: CPU backend algorithm, or "N/A" if not available.
+            str: CPU backend algorithm, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "algo"], self._backends_table_name, "cpu_algo")
+        return self._get_data_from_cache(self._backends_cache, (0, "algo"), self._backends_table_name, "cpu_algo")
 
     @property
+    @_memoized("backends")
     def be_cpu_profile(self):
         """
         Retrieves the CPU backend profile from the backends data.
 
         Returns:
-            str: CPU backend profile, or "N/A" if not available.
+            str: CPU backend profile, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "profile"], self._backends_table_name, "cpu_profile")
+        return self._get_data_from_cache(self._backends_cache, (0, "profile"), self._backends_table_name, "cpu_profile")
 
     @property
+    @_memoized("backends")
     def be_cpu_hw_aes(self):
         """
         Retrieves the CPU backend hardware AES support status from the backends data.
 
         Returns:
-            bool: CPU backend hardware AES support status, or "N/A" if not available.
+            bool: CPU backend hardware AES support status, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "hw-aes"], self._backends_table_name, "cpu_hw_aes")
+        return self._get_data_from_cache(self._backends_cache, (0, "hw-aes"), self._backends_table_name, "cpu_hw_aes")
 
     @property
+    @_memoized("backends")
     def be_cpu_priority(self):
         """
         Retrieves the CPU backend priority from the backends data.
 
         Returns:
-            int: CPU backend priority, or "N/A" if not available.
+            int: CPU backend priority, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "priority"], self._backends_table_name, "cpu_priority")
+        return self._get_data_from_cache(self._backends_cache, (0, "priority"), self._backends_table_name, "cpu_priority")
 
     @property
+    @_memoized("backends")
     def be_cpu_msr(self):
         """
         Retrieves the CPU backend MSR support status from the backends data.
 
         Returns:
-            bool: CPU backend MSR support status, or "N/A" if not available.
+            bool: CPU backend MSR support status, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "msr"], self._backends_table_name, "cpu_msr")
+        return self._get_data_from_cache(self._backends_cache, (0, "msr"), self._backends_table_name, "cpu_msr")
 
     @property
+    @_memoized("backends")
     def be_cpu_asm(self):
         """
         Retrieves the CPU backend assembly information from the backends data.
 
         Returns:
-            str: CPU backend assembly information, or "N/A" if not available.
+            str: CPU backend assembly information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "asm"], self._backends_table_name, "cpu_asm")
+        return self._get_data_from_cache(self._backends_cache, (0, "asm"), self._backends_table_name, "cpu_asm")
 
     @property
+    @_memoized("backends")
     def be_cpu_argon2_impl(self):
         """
         Retrieves the CPU backend Argon2 implementation from the backends data.
 
         Returns:
-            str: CPU backend Argon2 implementation, or "N/A" if not available.
+            str: CPU backend Argon2 implementation, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "argon2-impl"], self._backends_table_name, "cpu_argon2_impl")
+        return self._get_data_from_cache(self._backends_cache, (0, "argon2-impl"), self._backends_table_name, "cpu_argon2_impl")
 
     @property
+    @_memoized("backends")
     def be_cpu_hugepages(self):
         """
         Retrieves the CPU backend hugepages information from the backends data.
 
         Returns:
-            list: CPU backend hugepages information, or "N/A" if not available.
+            list: CPU backend hugepages information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "hugepages"], self._backends_table_name, "cpu_hugepages")
+        return self._get_data_from_cache(self._backends_cache, (0, "hugepages"), self._backends_table_name, "cpu_hugepages")
 
     @property
+    @_memoized("backends")
     def be_cpu_memory(self):
         """
         Retrieves the CPU backend memory information from the backends data.
 
         Returns:
-            int: CPU backend memory information, or "N/A" if not available.
+            int: CPU backend memory information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "memory"], self._backends_table_name, "cpu_memory")
+        return self._get_data_from_cache(self._backends_cache, (0, "memory"), self._backends_table_name, "cpu_memory")
 
     @property
+    @_memoized("backends")
     def be_cpu_hashrates(self):
         """
         Retrieves the CPU backend hashrates from the backends data.
 
         Returns:
-            list: CPU backend hashrates, or "N/A" if not available.
+            list: CPU backend hashrates, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "hashrate"], self._backends_table_name, "cpu_hashrate")
+        return self._get_data_from_cache(self._backends_cache, (0, "hashrate"), self._backends_table_name, "cpu_hashrate")
 
     @property
+    @_memoized("backends")
     def be_cpu_hashrate_10s(self):
         """
         Retrieves the CPU backend hashrate for the last 10 seconds from the backends data.
 
         Returns:
-            float: CPU backend hashrate for the last 10 seconds, or "N/A" if not available.
+            float: CPU backend hashrate for the last 10 seconds, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [0, "hashrate"], self._backends_table_name, "cpu_hashrate")
-        return result[0] if result != "N/A" else result
+        result = self.be_cpu_hashrates
+        return result[0] if isinstance(result, list) and len(result) > 0 else None
 
     @property
+    @_memoized("backends")
     def be_cpu_hashrate_1m(self):
         """
         Retrieves the CPU backend hashrate for the last 1 minute from the backends data.
 
         Returns:
-            float: CPU backend hashrate for the last 1 minute, or "N/A" if not available.
+            float: CPU backend hashrate for the last 1 minute, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [0, "hashrate"], self._backends_table_name, "cpu_hashrate")
-        return result[1] if result != "N/A" else result
+        result = self.be_cpu_hashrates
+        return result[1] if isinstance(result, list) and len(result) > 1 else None
 
     @property
+    @_memoized("backends")
     def be_cpu_hashrate_15m(self):
         """
         Retrieves the CPU backend hashrate for the last 15 minutes from the backends data.
 
         Returns:
-            float: CPU backend hashrate for the last 15 minutes, or "N/A" if not available.
+            float: CPU backend hashrate for the last 15 minutes, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [0, "hashrate"], self._backends_table_name, "cpu_hashrate")
-        return result[2] if result != "N/A" else result
+        result = self.be_cpu_hashrates
+        return result[2] if isinstance(result, list) and len(result) > 2 else None
     
     @property
+    @_memoized("backends")
     def be_cpu_threads(self):
         """
         Retrieves the CPU backend threads information from the backends data.
 
         Returns:
-            list: CPU backend threads information, or "N/A" if not available.
+            list: CPU backend threads information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads")
+        return self._get_data_from_cache(self._backends_cache, (0, "threads"), self._backends_table_name, "cpu_threads")
 
-    @property
-    def be_cpu_threads_intensity(self):
+    @_memoized("backends")
+    def _be_cpu_threads_columns(self):
         """
-        Retrieves the CPU backend threads intensity information from the backends data.
+        Collects the CPU backend thread values used by the `be_cpu_threads_*` properties in a single pass over the threads.
 
         Returns:
-            list: CPU backend threads intensity information, or "N/A" if not available.
+            dict: Lists of the thread values keyed by property name suffix, or None if not available.
         """
-        intensities = []
+        threads = self._get_data_from_cache(self._backends_cache, (0, "threads"), self._backends_table_name, "cpu_threads")
+        if not isinstance(threads, list):
+            return None
+        intensities, affinities, avs, hashrates, hashrates_10s, hashrates_1m, hashrates_15m = [], [], [], [], [], [], []
         try:
-            threads = self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads")
             for i in threads:
                 intensities.append(i["intensity"])
-        except TypeError as e:
-            return "N/A"
-        return intensities
+                affinities.append(i["affinity"])
+                avs.append(i["av"])
+                hashrate = i["hashrate"]
+                hashrates.append(hashrate)
+                hashrates_10s.append(hashrate[0])
+                hashrates_1m.append(hashrate[1])
+                hashrates_15m.append(hashrate[2])
+        except (KeyError, TypeError):
+            return None
+        return {
+            "intensity": intensities,
+            "affinity": affinities,
+            "av": avs,
+            "hashrates": hashrates,
+            "hashrates_10s": hashrates_10s,
+            "hashrates_1m": hashrates_1m,
+            "hashrates_15m": hashrates_15m,
+        }
+
+    @property
+    @_memoized("backends")
+    def be_cpu_threads_intensity(self):
+        """
+        Retrieves the CPU backend threads intensity information from the backends data.
+
+        Returns:
+            list: CPU backend threads intensity information, or None if not available.
+        """
+        columns = self._be_cpu_threads_columns()
+        return columns["intensity"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_affinity(self):
         """
         Retrieves the CPU backend threads affinity information from the backends data.
 
         Returns:
-            list: CPU backend threads affinity information, or "N/A" if not available.
+            list: CPU backend threads affinity information, or None if not available.
         """
-        affinities = []
-        try:
-            for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    affinities.append(i["affinity"])
-        except TypeError as e:
-            return "N/A"
-        return affinities
+        columns = self._be_cpu_threads_columns()
+        return columns["affinity"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_av(self):
         """
         Retrieves the CPU backend threads AV information from the backends data.
 
         Returns:
-            list: CPU backend threads AV information, or "N/A" if not available.
+            list: CPU backend threads AV information, or None if not available.
         """
-        avs = []
-        try:
-            for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    avs.append(i["av"])
-        except TypeError as e:
-            return "N/A"
-        return avs
+        columns = self._be_cpu_threads_columns()
+        return columns["av"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_hashrates(self):
         """
         Retrieves the CPU backend threads hashrates information from the backends data.
 
         Returns:
-            list: CPU backend threads hashrates information, or "N/A" if not available.
+            list: CPU backend threads hashrates information, or None if not available.
         """
-        hashrates = []
-        try:
-            for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    hashrates.append(i["hashrate"])
-        except TypeError as e:
-            return "N/A"
-        return hashrates
+        columns = self._be_cpu_threads_columns()
+        return columns["hashrates"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_hashrates_10s(self):
         """
         Retrieves the CPU backend threads hashrates for the last 10 seconds from the backends data.
 
         Returns:
-            list: CPU backend threads hashrates for the last 10 seconds, or "N/A" if not available.
+            list: CPU backend threads hashrates for the last 10 seconds, or None if not available.
         """
-        hashrates_10s = []
-        try:
-            for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    hashrates_10s.append(i["hashrate"][0])
-        except TypeError as e:
-            return "N/A"
-        return hashrates_10s
+        columns = self._be_cpu_threads_columns()
+        return columns["hashrates_10s"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_hashrates_1m(self):
         """
         Retrieves the CPU backend threads hashrates for the last 1 minute from the backends data.
 
         Returns:
-            list: CPU backend threads hashrates for the last 1 minute, or "N/A" if not available.
+            list: CPU backend threads hashrates for the last 1 minute, or None if not available.
         """
-        hashrates_1m = []
-        try:
-           for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    hashrates_1m.append(i["hashrate"][1])
-        except TypeError as e:
-            return "N/A"
-        return hashrates_1m
+        columns = self._be_cpu_threads_columns()
+        return columns["hashrates_1m"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_cpu_threads_hashrates_15m(self):
         """
         Retrieves the CPU backend threads hashrates for the last 15 minutes from the backends data.
 
         Returns:
-            list: CPU backend threads hashrates for the last 15 minutes, or "N/A" if not available.
+            list: CPU backend threads hashrates for the last 15 minutes, or None if not available.
         """
-        hashrates_15m = []
-        try:
-            for i in self._get_data_from_cache(self._backends_cache, [0, "threads"], self._backends_table_name, "cpu_threads"):
-                    hashrates_15m.append(i["hashrate"][2])
-        except TypeError as e:
-            return "N/A"
-        return hashrates_15m
+        columns = self._be_cpu_threads_columns()
+        return columns["hashrates_15m"] if columns is not None else None
 
     @property
+    @_memoized("backends")
     def be_opencl_type(self):
         """
         Retrieves the OpenCL backend type from the backends data.
 
         Returns:
-            str: OpenCL backend type, or "N/A" if not available.
+            str: OpenCL backend type, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "type"], self._backends_table_name, "opencl_type")
+        return self._get_data_from_cache(self._backends_cache, (1, "type"), self._backends_table_name, "opencl_type")
 
     @property
+    @_memoized("backends")
     def be_opencl_enabled(self):
         """
         Retrieves the OpenCL backend enabled status from the backends data.
 
         Returns:
-            bool: OpenCL backend enabled status, or "N/A" if not available.
+            bool: OpenCL backend enabled status, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "enabled"], self._backends_table_name, "opencl_enabled")
+        return self._get_data_from_cache(self._backends_cache, (1, "enabled"), self._backends_table_name, "opencl_enabled")
 
     @property
+    @_memoized("backends")
     def be_opencl_algo(self):
         """
         Retrieves the OpenCL backend algorithm from the backends data.
 
         Returns:
-            str: OpenCL backend algorithm, or "N/A" if not available.
+            str: OpenCL backend algorithm, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "algo"], self._backends_table_name, "opencl_algo")
+        return self._get_data_from_cache(self._backends_cache, (1, "algo"), self._backends_table_name, "opencl_algo")
 
     @property
+    @_memoized("backends")
     def be_opencl_profile(self):
         """
         Retrieves the OpenCL backend profile from the backends data.
 
         Returns:
-            str: OpenCL backend profile, or "N/A" if not available.
+            str: OpenCL backend profile, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "profile"], self._backends_table_name, "opencl_profile")
+        return self._get_data_from_cache(self._backends_cache, (1, "profile"), self._backends_table_name, "opencl_profile")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform(self):
         """
         Retrieves the OpenCL backend platform information from the backends data.
 
         Returns:
-            dict: OpenCL backend platform information, or "N/A" if not available.
+            dict: OpenCL backend platform information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform"], self._backends_table_name, "opencl_platform")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform"), self._backends_table_name, "opencl_platform")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_index(self):
         """
         Retrieves the OpenCL backend platform index from the backends data.
 
         Returns:
-            int: OpenCL backend platform index, or "N/A" if not available.
+            int: OpenCL backend platform index, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "index"], self._backends_table_name, "opencl_platform_index")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "index"), self._backends_table_name, "opencl_platform_index")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_profile(self):
         """
         Retrieves the OpenCL backend platform profile from the backends data.
 
         Returns:
-            str: OpenCL backend platform profile, or "N/A" if not available.
+            str: OpenCL backend platform profile, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "profile"], self._backends_table_name, "opencl_platform_profile")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "profile"), self._backends_table_name, "opencl_platform_profile")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_version(self):
         """
         Retrieves the OpenCL backend platform version from the backends data.
 
         Returns:
-            str: OpenCL backend platform version, or "N/A" if not available.
+            str: OpenCL backend platform version, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "version"], self._backends_table_name, "opencl_platform_version")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "version"), self._backends_table_name, "opencl_platform_version")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_name(self):
         """
         Retrieves the OpenCL backend platform name from the backends data.
 
         Returns:
-            str: OpenCL backend platform name, or "N/A" if not available.
+            str: OpenCL backend platform name, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "name"], self._backends_table_name, "opencl_platform_name")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "name"), self._backends_table_name, "opencl_platform_name")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_vendor(self):
         """
         Retrieves the OpenCL backend platform vendor from the backends data.
 
         Returns:
-            str: OpenCL backend platform vendor, or "N/A" if not available.
+            str: OpenCL backend platform vendor, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "vendor"], self._backends_table_name, "opencl_platform_vendor")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "vendor"), self._backends_table_name, "opencl_platform_vendor")
 
     @property
+    @_memoized("backends")
     def be_opencl_platform_extensions(self):
         """
         Retrieves the OpenCL backend platform extensions from the backends data.
 
         Returns:
-            str: OpenCL backend platform extensions, or "N/A" if not available.
+            str: OpenCL backend platform extensions, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "platform", "extensions"], self._backends_table_name, "opencl_platform_extensions")
+        return self._get_data_from_cache(self._backends_cache, (1, "platform", "extensions"), self._backends_table_name, "opencl_platform_extensions")
 
     @property
+    @_memoized("backends")
     def be_opencl_hashrates(self):
         """
         Retrieves the OpenCL backend hashrates from the backends data.
 
         Returns:
-            list: OpenCL backend hashrates, or "N/A" if not available.
+            list: OpenCL backend hashrates, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "hashrate"], self._backends_table_name, "opencl_hashrate")
+        return self._get_data_from_cache(self._backends_cache, (1, "hashrate"), self._backends_table_name, "opencl_hashrate")
 
     @property
+    @_memoized("backends")
     def be_opencl_hashrate_10s(self):
         """
         Retrieves the OpenCL backend hashrate for the last 10 seconds from the backends data.
 
         Returns:
-            float: OpenCL backend hashrate for the last 10 seconds, or "N/A" if not available.
+            float: OpenCL backend hashrate for the last 10 seconds, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [1, "hashrate"], self._backends_table_name, "opencl_hashrate")
-        return result[0] if result != "N/A" else result
+        result = self.be_opencl_hashrates
+        return result[0] if isinstance(result, list) and len(result) > 0 else None
 
     @property
+    @_memoized("backends")
     def be_opencl_hashrate_1m(self):
         """
         Retrieves the OpenCL backend hashrate for the last 1 minute from the backends data.
 
         Returns:
-            float: OpenCL backend hashrate for the last 1 minute, or "N/A" if not available.
+            float: OpenCL backend hashrate for the last 1 minute, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [1, "hashrate"], self._backends_table_name, "opencl_hashrate")
-        return result[1] if result != "N/A" else result
+        result = self.be_opencl_hashrates
+        return result[1] if isinstance(result, list) and len(result) > 1 else None
 
     @property
+    @_memoized("backends")
     def be_opencl_hashrate_15m(self):
         """
         Retrieves the OpenCL backend hashrate for the last 15 minutes from the backends data.
 
         Returns:
-            float: OpenCL backend hashrate for the last 15 minutes, or "N/A" if not available.
+            float: OpenCL backend hashrate for the last 15 minutes, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [1, "hashrate"], self._backends_table_name, "opencl_hashrate")
-        return result[2] if result != "N/A" else result
+        result = self.be_opencl_hashrates
+        return result[2] if isinstance(result, list) and len(result) > 2 else None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads(self):
         """
         Retrieves the OpenCL backend threads information from the backends data.
 
         Returns:
-            list: OpenCL backend threads information, or "N/A" if not available.
+            list: OpenCL backend threads information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads")
+        return self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_index(self):
         """
         Retrieves the OpenCL backend threads index from the backends data.
 
         Returns:
-            list: OpenCL backend threads index, or "N/A" if not available.
+            list: OpenCL backend threads index, or None if not available.
         """
-        indexes = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                    indexes.append(i["index"])
-        except TypeError as e:
-            return "N/A"
-        return indexes
+            return [i["index"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_intensity(self):
         """
         Retrieves the OpenCL backend threads intensity from the backends data.
 
         Returns:
-            list: OpenCL backend threads intensity, or "N/A" if not available.
+            list: OpenCL backend threads intensity, or None if not available.
         """
-        intensities = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                intensities.append(i["intensity"])
-        except TypeError as e:
-            return "N/A"
-        return intensities
+            return [i["intensity"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_worksize(self):
         """
         Retrieves the OpenCL backend threads worksize from the backends data.
 
         Returns:
-            list: OpenCL backend threads worksize, or "N/A" if not available.
+            list: OpenCL backend threads worksize, or None if not available.
         """
-        worksizes = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                worksizes.append(i["worksize"])
-        except TypeError as e:
-            return "N/A"
-        return worksizes
+            return [i["worksize"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_unroll(self):
         """
         Retrieves the OpenCL backend threads unroll from the backends data.
 
         Returns:
-            list: OpenCL backend threads unroll, or "N/A" if not available.
+            list: OpenCL backend threads unroll, or None if not available.
         """
-        unrolls = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                unrolls.append(i["unroll"])
-        except TypeError as e:
-            return "N/A"
-        return unrolls
+            return [i["unroll"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_affinity(self):
         """
         Retrieves the OpenCL backend threads affinity from the backends data.
 
         Returns:
-            list: OpenCL backend threads affinity, or "N/A" if not available.
+            list: OpenCL backend threads affinity, or None if not available.
         """
-        affinities = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                affinities.append(i["affinity"])
-        except TypeError as e:
-            return "N/A"
-        return affinities
+            return [i["affinity"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_hashrates(self):
         """
         Retrieves the OpenCL backend threads hashrates from the backends data.
 
         Returns:
-            list: OpenCL backend threads hashrates, or "N/A" if not available.
+            list: OpenCL backend threads hashrates, or None if not available.
         """
-        hashrates = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                hashrates.append(i["hashrate"])
-        except TypeError as e:
-            return "N/A"
-        return hashrates
+            return [i["hashrate"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_hashrate_10s(self):
         """
         Retrieves the OpenCL backend threads hashrate for the last 10 seconds from the backends data.
 
         Returns:
-            list: OpenCL backend threads hashrate for the last 10 seconds, or "N/A" if not available.
+            list: OpenCL backend threads hashrate for the last 10 seconds, or None if not available.
         """
-        hashrates_10s = []
+        hashrates = self.be_opencl_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                hashrates_10s.append(i["hashrate"][0])
-        except KeyError:
-            return "N/A"
-        return hashrates_10s
+            return [hashrate[0] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_hashrate_1m(self):
         """
         Retrieves the OpenCL backend threads hashrate for the last 1 minute from the backends data.
 
         Returns:
-            list: OpenCL backend threads hashrate for the last 1 minute, or "N/A" if not available.
+            list: OpenCL backend threads hashrate for the last 1 minute, or None if not available.
         """
-        hashrates_1m = []
+        hashrates = self.be_opencl_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                hashrates_1m.append(i["hashrate"][1])
-        except KeyError:
-            return "N/A"
-        return hashrates_1m
+            return [hashrate[1] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_hashrate_15m(self):
         """
         Retrieves the OpenCL backend threads hashrate for the last 15 minutes from the backends data.
 
         Returns:
-            list: OpenCL backend threads hashrate for the last 15 minutes, or "N/A" if not available.
+            list: OpenCL backend threads hashrate for the last 15 minutes, or None if not available.
         """
-        hashrates_15m = []
+        hashrates = self.be_opencl_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                hashrates_15m.append(i["hashrate"][2])
-        except KeyError:
-            return "N/A"
-        return hashrates_15m
+            return [hashrate[2] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_board(self):
         """
         Retrieves the OpenCL backend threads board information from the backends data.
 
         Returns:
-            list: OpenCL backend threads board information, or "N/A" if not available.
+            list: OpenCL backend threads board information, or None if not available.
         """
-        boards = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                boards.append(i["board"])
-        except KeyError:
-            return "N/A"
-        return boards
+            return [i["board"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_name(self):
         """
         Retrieves the OpenCL backend threads name from the backends data.
 
         Returns:
-            list: OpenCL backend threads name, or "N/A" if not available.
+            list: OpenCL backend threads name, or None if not available.
         """
-        names = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                names.append(i["name"])
-        except KeyError:
-            return "N/A"
-        return names
+            return [i["name"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_bus_id(self):
         """
         Retrieves the OpenCL backend threads bus ID from the backends data.
 
         Returns:
-            list: OpenCL backend threads bus ID, or "N/A" if not available.
+            list: OpenCL backend threads bus ID, or None if not available.
         """
-        bus_ids = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                bus_ids.append(i["bus_id"])
-        except KeyError:
-            return "N/A"
-        return bus_ids
+            return [i["bus_id"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_cu(self):
         """
         Retrieves the OpenCL backend threads compute units from the backends data.
 
         Returns:
-            list: OpenCL backend threads compute units, or "N/A" if not available.
+            list: OpenCL backend threads compute units, or None if not available.
         """
-        cus = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                cus.append(i["cu"])
-        except KeyError:
-            return "N/A"
-        return cus
+            return [i["cu"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_global_mem(self):
         """
         Retrieves the OpenCL backend threads global memory from the backends data.
 
         Returns:
-            list: OpenCL backend threads global memory, or "N/A" if not available.
+            list: OpenCL backend threads global memory, or None if not available.
         """
-        global_mems = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                global_mems.append(i["global_mem"])
-        except KeyError:
-            return "N/A"
-        return global_mems
+            return [i["global_mem"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health(self):
         """
         Retrieves the OpenCL backend threads health information from the backends data.
 
         Returns:
-            list: OpenCL backend threads health information, or "N/A" if not available.
+            list: OpenCL backend threads health information, or None if not available.
         """
-        healths = []
+        threads = self._get_data_from_cache(self._backends_cache, (1, "threads"), self._backends_table_name, "opencl_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                healths.append(i["health"])
-        except KeyError:
-            return "N/A"
-        return healths
+            return [i["health"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health_temp(self):
         """
         Retrieves the OpenCL backend threads health temperature from the backends data.
 
         Returns:
-            list: OpenCL backend threads health temperature, or "N/A" if not available.
+            list: OpenCL backend threads health temperature, or None if not available.
         """
-        temps = []
+        healths = self.be_opencl_threads_health
+        if healths is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                temps.append(i["health"]["temperature"])
-        except KeyError:
-            return "N/A"
-        return temps
+            return [health["temperature"] for health in healths]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health_power(self):
         """
         Retrieves the OpenCL backend threads health power from the backends data.
 
         Returns:
-            list: OpenCL backend threads health power, or "N/A" if not available.
+            list: OpenCL backend threads health power, or None if not available.
         """
-        powers = []
+        healths = self.be_opencl_threads_health
+        if healths is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                powers.append(i["health"]["power"])
-        except KeyError:
-            return "N/A"
-        return powers
+            return [health["power"] for health in healths]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health_clock(self):
         """
         Retrieves the OpenCL backend threads health clock from the backends data.
 
         Returns:
-            list: OpenCL backend threads health clock, or "N/A" if not available.
+            list: OpenCL backend threads health clock, or None if not available.
         """
-        clocks = []
+        healths = self.be_opencl_threads_health
+        if healths is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                clocks.append(i["health"]["clock"])
-        except KeyError:
-            return "N/A"
-        return clocks
+            return [health["clock"] for health in healths]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health_mem_clock(self):
         """
         Retrieves the OpenCL backend threads health memory clock from the backends data.
 
         Returns:
-            list: OpenCL backend threads health memory clock, or "N/A" if not available.
+            list: OpenCL backend threads health memory clock, or None if not available.
         """
-        mem_clocks = []
+        healths = self.be_opencl_threads_health
+        if healths is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                mem_clocks.append(i["health"]["mem_clock"])
-        except KeyError:
-            return "N/A"
-        return mem_clocks
+            return [health["mem_clock"] for health in healths]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_opencl_threads_health_rpm(self):
         """
         Retrieves the OpenCL backend threads health RPM from the backends data.
 
         Returns:
-            list: OpenCL backend threads health RPM, or "N/A" if not available.
+            list: OpenCL backend threads health RPM, or None if not available.
         """
-        rpms = []
+        healths = self.be_opencl_threads_health
+        if healths is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [1, "threads"], self._backends_table_name, "opencl_threads"):
-                rpms.append(i["health"]["rpm"])
-        except KeyError:
-            return "N/A"
-        return rpms
+            return [health["rpm"] for health in healths]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_type(self):
         """
         Retrieves the CUDA backend type from the backends data.
 
         Returns:
-            str: CUDA backend type, or "N/A" if not available.
+            str: CUDA backend type, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "type"], self._backends_table_name, "cuda_type")
+        return self._get_data_from_cache(self._backends_cache, (2, "type"), self._backends_table_name, "cuda_type")
 
     @property
+    @_memoized("backends")
     def be_cuda_enabled(self):
         """
         Retrieves the CUDA backend enabled status from the backends data.
 
         Returns:
-            bool: CUDA backend enabled status, or "N/A" if not available.
+            bool: CUDA backend enabled status, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "enabled"], self._backends_table_name, "cuda_enabled")
+        return self._get_data_from_cache(self._backends_cache, (2, "enabled"), self._backends_table_name, "cuda_enabled")
 
     @property
+    @_memoized("backends")
     def be_cuda_algo(self):
         """
         Retrieves the CUDA backend algorithm from the backends data.
 
         Returns:
-            str: CUDA backend algorithm, or "N/A" if not available.
+            str: CUDA backend algorithm, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "algo"], self._backends_table_name, "cuda_algo")
+        return self._get_data_from_cache(self._backends_cache, (2, "algo"), self._backends_table_name, "cuda_algo")
 
     @property
+    @_memoized("backends")
     def be_cuda_profile(self):
         """
         Retrieves the CUDA backend profile from the backends data.
 
         Returns:
-            str: CUDA backend profile, or "N/A" if not available.
+            str: CUDA backend profile, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "profile"], self._backends_table_name, "cuda_profile")
+        return self._get_data_from_cache(self._backends_cache, (2, "profile"), self._backends_table_name, "cuda_profile")
 
     @property
+    @_memoized("backends")
     def be_cuda_versions(self):
         """
         Retrieves the CUDA backend versions information from the backends data.
 
         Returns:
-            dict: CUDA backend versions information, or "N/A" if not available.
+            dict: CUDA backend versions information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "versions"], self._backends_table_name, "cuda_versions")
+        return self._get_data_from_cache(self._backends_cache, (2, "versions"), self._backends_table_name, "cuda_versions")
 
     @property
+    @_memoized("backends")
     def be_cuda_runtime(self):
         """
         Retrieves the CUDA backend runtime version from the backends data.
 
         Returns:
-            str: CUDA backend runtime version, or "N/A" if not available.
+            str: CUDA backend runtime version, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "versions", "cuda-runtime"], self._backends_table_name, "cuda_versions_cuda_runtime")
+        return self._get_data_from_cache(self._backends_cache, (2, "versions", "cuda-runtime"), self._backends_table_name, "cuda_versions_cuda_runtime")
 
     @property
+    @_memoized("backends")
     def be_cuda_driver(self):
         """
         Retrieves the CUDA backend driver version from the backends data.
 
         Returns:
-            str: CUDA backend driver version, or "N/A" if not available.
+            str: CUDA backend driver version, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "versions", "cuda-driver"], self._backends_table_name, "cuda_versions_cuda_driver")
+        return self._get_data_from_cache(self._backends_cache, (2, "versions", "cuda-driver"), self._backends_table_name, "cuda_versions_cuda_driver")
 
     @property
+    @_memoized("backends")
     def be_cuda_plugin(self):
         """
         Retrieves the CUDA backend plugin version from the backends data.
 
         Returns:
-            str: CUDA backend plugin version, or "N/A" if not available.
+            str: CUDA backend plugin version, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "versions", "plugin"], self._backends_table_name, "cuda_versions_plugin")
+        return self._get_data_from_cache(self._backends_cache, (2, "versions", "plugin"), self._backends_table_name, "cuda_versions_plugin")
 
     @property
+    @_memoized("backends")
     def be_cuda_hashrates(self):
         """
         Retrieves the CUDA backend hashrates from the backends data.
 
         Returns:
-            list: CUDA backend hashrates, or "N/A" if not available.
+            list: CUDA backend hashrates, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "hashrate"], self._backends_table_name, "cuda_hashrate")
+        return self._get_data_from_cache(self._backends_cache, (2, "hashrate"), self._backends_table_name, "cuda_hashrate")
 
     @property
+    @_memoized("backends")
     def be_cuda_hashrate_10s(self):
         """
         Retrieves the CUDA backend hashrate for the last 10 seconds from the backends data.
 
         Returns:
-            float: CUDA backend hashrate for the last 10 seconds, or "N/A" if not available.
+            float: CUDA backend hashrate for the last 10 seconds, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [2, "hashrate"], self._backends_table_name, "cuda_hashrate")
-        return result[0] if result != "N/A" else result
+        result = self.be_cuda_hashrates
+        return result[0] if isinstance(result, list) and len(result) > 0 else None
 
     @property
+    @_memoized("backends")
     def be_cuda_hashrate_1m(self):
         """
         Retrieves the CUDA backend hashrate for the last 1 minute from the backends data.
 
         Returns:
-            float: CUDA backend hashrate for the last 1 minute, or "N/A" if not available.
+            float: CUDA backend hashrate for the last 1 minute, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [2, "hashrate"], self._backends_table_name, "cuda_hashrate")
-        return result[1] if result != "N/A" else result
+        result = self.be_cuda_hashrates
+        return result[1] if isinstance(result, list) and len(result) > 1 else None
 
     @property
+    @_memoized("backends")
     def be_cuda_hashrate_15m(self):
         """
         Retrieves the CUDA backend hashrate for the last 15 minutes from the backends data.
 
         Returns:
-            float: CUDA backend hashrate for the last 15 minutes, or "N/A" if not available.
+            float: CUDA backend hashrate for the last 15 minutes, or None if not available.
         """
-        result = self._get_data_from_cache(self._backends_cache, [2, "hashrate"], self._backends_table_name, "cuda_hashrate")
-        return result[2] if result != "N/A" else result
+        result = self.be_cuda_hashrates
+        return result[2] if isinstance(result, list) and len(result) > 2 else None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads(self):
         """
         Retrieves the CUDA backend threads information from the backends data.
 
         Returns:
-            list: CUDA backend threads information, or "N/A" if not available.
+            list: CUDA backend threads information, or None if not available.
         """
-        return self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads")
+        return self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_index(self):
         """
         Retrieves the CUDA backend threads index from the backends data.
 
         Returns:
-            list: CUDA backend threads index, or "N/A" if not available.
+            list: CUDA backend threads index, or None if not available.
         """
-        indexes = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                indexes.append(i["index"])
-        except KeyError:
-            return "N/A"
-        return indexes
+            return [i["index"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_blocks(self):
         """
         Retrieves the CUDA backend threads blocks from the backends data.
 
         Returns:
-            list: CUDA backend threads blocks, or "N/A" if not available.
+            list: CUDA backend threads blocks, or None if not available.
         """
-        blocks = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                blocks.append(i["blocks"])
-        except KeyError:
-            return "N/A"
-        return blocks
+            return [i["blocks"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_bfactor(self):
         """
         Retrieves the CUDA backend threads bfactor from the backends data.
 
         Returns:
-            list: CUDA backend threads bfactor, or "N/A" if not available.
+            list: CUDA backend threads bfactor, or None if not available.
         """
-        bfactors = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                bfactors.append(i["bfactor"])
-        except KeyError:
-            return "N/A"
-        return bfactors
+            return [i["bfactor"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_bsleep(self):
         """
         Retrieves the CUDA backend threads bsleep from the backends data.
 
         Returns:
-            list: CUDA backend threads bsleep, or "N/A" if not available.
+            list: CUDA backend threads bsleep, or None if not available.
         """
-        bsleeps = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                bsleeps.append(i["bsleep"])
-        except KeyError:
-            return "N/A"
-        return bsleeps
+            return [i["bsleep"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_affinity(self):
         """
         Retrieves the CUDA backend threads affinity from the backends data.
 
         Returns:
-            list: CUDA backend threads affinity, or "N/A" if not available.
+            list: CUDA backend threads affinity, or None if not available.
         """
-        affinities = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                affinities.append(i["affinity"])
-        except KeyError:
-            return "N/A"
-        return affinities
+            return [i["affinity"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_dataset_host(self):
         """
         Retrieves the CUDA backend threads dataset host status from the backends data.
 
         Returns:
-            list: CUDA backend threads dataset host status, or "N/A" if not available.
+            list: CUDA backend threads dataset host status, or None if not available.
         """
-        dataset_hosts = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                dataset_hosts.append(i["dataset_host"])
-        except KeyError:
-            return "N/A"
-        return dataset_hosts
+            return [i["dataset_host"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_hashrates(self):
         """
         Retrieves the CUDA backend threads hashrates from the backends data.
 
         Returns:
-            list: CUDA backend threads hashrates, or "N/A" if not available.
+            list: CUDA backend threads hashrates, or None if not available.
         """
-        hashrates = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                hashrates.append(i["hashrate"])
-        except KeyError:
-            return "N/A"
-        return hashrates
+            return [i["hashrate"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_hashrate_10s(self):
         """
         Retrieves the CUDA backend threads hashrate for the last 10 seconds from the backends data.
 
         Returns:
-            list: CUDA backend threads hashrate for the last 10 seconds, or "N/A" if not available.
+            list: CUDA backend threads hashrate for the last 10 seconds, or None if not available.
         """
-        hashrates_10s = []
+        hashrates = self.be_cuda_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                hashrates_10s.append(i["hashrate"][0])
-        except KeyError:
-            return "N/A"
-        return hashrates_10s
+            return [hashrate[0] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_hashrate_1m(self):
         """
         Retrieves the CUDA backend threads hashrate for the last 1 minute from the backends data.
 
         Returns:
-            list: CUDA backend threads hashrate for the last 1 minute, or "N/A" if not available.
+            list: CUDA backend threads hashrate for the last 1 minute, or None if not available.
         """
-        hashrates_1m = []
+        hashrates = self.be_cuda_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                hashrates_1m.append(i["hashrate"][1])
-        except KeyError:
-            return "N/A"
-        return hashrates_1m
+            return [hashrate[1] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_hashrate_15m(self):
         """
         Retrieves the CUDA backend threads hashrate for the last 15 minutes from the backends data.
 
         Returns:
-            list: CUDA backend threads hashrate for the last 15 minutes, or "N/A" if not available.
+            list: CUDA backend threads hashrate for the last 15 minutes, or None if not available.
         """
-        hashrates_15m = []
+        hashrates = self.be_cuda_threads_hashrates
+        if hashrates is None:
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                hashrates_15m.append(i["hashrate"][2])
-        except KeyError:
-            return "N/A"
-        return hashrates_15m
+            return [hashrate[2] for hashrate in hashrates]
+        except (IndexError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_name(self):
         """
         Retrieves the CUDA backend threads name from the backends data.
 
         Returns:
-            list: CUDA backend threads name, or "N/A" if not available.
+            list: CUDA backend threads name, or None if not available.
         """
-        names = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                names.append(i["name"])
-        except KeyError:
-            return "N/A"
-        return names
+            return [i["name"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_bus_id(self):
         """
         Retrieves the CUDA backend threads bus ID from the backends data.
 
         Returns:
-            list: CUDA backend threads bus ID, or "N/A" if not available.
+            list: CUDA backend threads bus ID, or None if not available.
         """
-        bus_ids = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                bus_ids.append(i["bus_id"])
-        except KeyError:
-            return "N/A"
-        return bus_ids
+            return [i["bus_id"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_smx(self):
         """
         Retrieves the CUDA backend threads SMX count from the backends data.
 
         Returns:
-            list: CUDA backend threads SMX count, or "N/A" if not available.
+            list: CUDA backend threads SMX count, or None if not available.
         """
-        smxs = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                smxs.append(i["smx"])
-        except KeyError:
-            return "N/A"
-        return smxs
+            return [i["smx"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_arch(self):
         """
         Retrieves the CUDA backend threads architecture from the backends data.
 
         Returns:
-            list: CUDA backend threads architecture, or "N/A" if not available.
+            list: CUDA backend threads architecture, or None if not available.
         """
-        archs = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                archs.append(i["arch"])
-        except KeyError:
-            return "N/A"
-        return archs
+            return [i["arch"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_global_mem(self):
         """
         Retrieves the CUDA backend threads global memory from the backends data.
 
         Returns:
-            list: CUDA backend threads global memory, or "N/A" if not available.
+            list: CUDA backend threads global memory, or None if not available.
         """
-        global_mems = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                global_mems.append(i["global_mem"])
-        except KeyError:
-            return "N/A"
-        return global_mems
+            return [i["global_mem"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_clock(self):
         """
         Retrieves the CUDA backend threads clock from the backends data.
 
         Returns:
-            list: CUDA backend threads clock, or "N/A" if not available.
+            list: CUDA backend threads clock, or None if not available.
         """
-        clocks = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                clocks.append(i["clock"])
-        except KeyError:
-            return "N/A"
-        return clocks
+            return [i["clock"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("backends")
     def be_cuda_threads_memory_clock(self):
         """
         Retrieves the CUDA backend threads memory clock from the backends data.
 
         Returns:
-            list: CUDA backend threads memory clock, or "N/A" if not available.
+            list: CUDA backend threads memory clock, or None if not available.
         """
-        memory_clocks = []
+        threads = self._get_data_from_cache(self._backends_cache, (2, "threads"), self._backends_table_name, "cuda_threads")
+        if not isinstance(threads, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._backends_cache, [2, "threads"], self._backends_table_name, "cuda_threads"):
-                memory_clocks.append(i["memory_clock"])
-        except KeyError:
-            return "N/A"
-        return memory_clocks
+            return [i["memory_clock"] for i in threads]
+        except (KeyError, TypeError):
+            return None
 
     #############################
     # Data from config endpoint #
     #############################
 
     @property
+    @_memoized("config")
     def conf_api_property(self):
         """
         Retrieves the API property from the config data.
 
         Returns:
-            dict: API property, or "N/A" if not available.
+            dict: API property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["api"], self._config_table_name, "api")
+        return self._get_data_from_cache(self._config_cache, ("api",), self._config_table_name, "api")
 
     @property
+    @_memoized("config")
     def conf_api_id_property(self):
         """
         Retrieves the API ID property from the config data.
 
         Returns:
-            str: API ID property, or "N/A" if not available.
+            str: API ID property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["api", "id"], self._config_table_name, "api_id")
+        return self._get_data_from_cache(self._config_cache, ("api", "id"), self._config_table_name, "api_id")
 
     @property
+    @_memoized("config")
     def conf_api_worker_id_property(self):
         """
         Retrieves the API worker ID property from the config data.
 
         Returns:
-            str: API worker ID property, or "N/A" if not available.
+            str: API worker ID property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["api", "worker-id"], self._config_table_name, "api_worker_id")
+        return self._get_data_from_cache(self._config_cache, ("api", "worker-id"), self._config_table_name, "api_worker_id")
 
     @property
+    @_memoized("config")
     def conf_http_property(self):
         """
         Retrieves the HTTP property from the config data.
 
         Returns:
-            dict: HTTP property, or "N/A" if not available.
+            dict: HTTP property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http"], self._config_table_name, "http")
+        return self._get_data_from_cache(self._config_cache, ("http",), self._config_table_name, "http")
 
     @property
+    @_memoized("config")
     def conf_http_enabled_property(self):
         """
         Retrieves the HTTP enabled property from the config data.
 
         Returns:
-            bool: HTTP enabled property, or "N/A" if not available.
+            bool: HTTP enabled property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http", "enabled"], self._config_table_name, "http_enabled")
+        return self._get_data_from_cache(self._config_cache, ("http", "enabled"), self._config_table_name, "http_enabled")
 
     @property
+    @_memoized("config")
     def conf_http_host_property(self):
         """
         Retrieves the HTTP host property from the config data.
 
         Returns:
-            str: HTTP host property, or "N/A" if not available.
+            str: HTTP host property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http", "host"], self._config_table_name, "http_host")
+        return self._get_data_from_cache(self._config_cache, ("http", "host"), self._config_table_name, "http_host")
 
     @property
+    @_memoized("config")
     def conf_http_port_property(self):
         """
         Retrieves the HTTP port property from the config data.
 
         Returns:
-            int: HTTP port property, or "N/A" if not available.
+            int: HTTP port property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http", "port"], self._config_table_name, "http_port")
+        return self._get_data_from_cache(self._config_cache, ("http", "port"), self._config_table_name, "http_port")
 
     @property
+    @_memoized("config")
     def conf_http_access_token_property(self):
         """
         Retrieves the HTTP access token property from the config data.
 
         Returns:
-            str: HTTP access token property, or "N/A" if not available.
+            str: HTTP access token property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http", "access-token"], self._config_table_name, "http_access_token")
+        return self._get_data_from_cache(self._config_cache, ("http", "access-token"), self._config_table_name, "http_access_token")
 
     @property
+    @_memoized("config")
     def conf_http_restricted_property(self):
         """
         Retrieves the HTTP restricted property from the config data.
 
         Returns:
-            bool: HTTP restricted property, or "N/A" if not available.
+            bool: HTTP restricted property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["http", "restricted"], self._config_table_name, "http_restricted")
+        return self._get_data_from_cache(self._config_cache, ("http", "restricted"), self._config_table_name, "http_restricted")
 
     @property
+    @_memoized("config")
     def conf_autosave_property(self):
         """
         Retrieves the autosave property from the config data.
 
         Returns:
-            bool: Autosave property, or "N/A" if not available.
+            bool: Autosave property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["autosave"], self._config_table_name, "autosave")
+        return self._get_data_from_cache(self._config_cache, ("autosave",), self._config_table_name, "autosave")
 
     @property
+    @_memoized("config")
     def conf_background_property(self):
         """
         Retrieves the background property from the config data.
 
         Returns:
-            bool: Background property, or "N/A" if not available.
+            bool: Background property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["background"], self._config_table_name, "background")
+        return self._get_data_from_cache(self._config_cache, ("background",), self._config_table_name, "background")
 
     @property
+    @_memoized("config")
     def conf_colors_property(self):
         """
         Retrieves the colors property from the config data.
 
         Returns:
-            bool: Colors property, or "N/A" if not available.
+            bool: Colors property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["colors"], self._config_table_name, "colors")
+        return self._get_data_from_cache(self._config_cache, ("colors",), self._config_table_name, "colors")
 
     @property
+    @_memoized("config")
     def conf_title_property(self):
         """
         Retrieves the title property from the config data.
 
         Returns:
-            bool: Title property, or "N/A" if not available.
+            bool: Title property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["title"], self._config_table_name, "title")
+        return self._get_data_from_cache(self._config_cache, ("title",), self._config_table_name, "title")
 
     @property
+    @_memoized("config")
     def conf_randomx_property(self):
         """
         Retrieves the RandomX property from the config data.
 
         Returns:
-            dict: RandomX property, or "N/A" if not available.
+            dict: RandomX property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx"], self._config_table_name, "randomx")
+        return self._get_data_from_cache(self._config_cache, ("randomx",), self._config_table_name, "randomx")
 
     @property
+    @_memoized("config")
     def conf_randomx_init_property(self):
         """
         Retrieves the RandomX init property from the config data.
 
         Returns:
-            int: RandomX init property, or "N/A" if not available.
+            int: RandomX init property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "init"], self._config_table_name, "randomx_init")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "init"), self._config_table_name, "randomx_init")
 
     @property
+    @_memoized("config")
     def conf_randomx_init_avx2_property(self):
         """
         Retrieves the RandomX init AVX2 property from the config data.
 
         Returns:
-            int: RandomX init AVX2 property, or "N/A" if not available.
+            int: RandomX init AVX2 property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "init-avx2"], self._config_table_name, "randomx_init_avx2")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "init-avx2"), self._config_table_name, "randomx_init_avx2")
 
     @property
+    @_memoized("config")
     def conf_randomx_mode_property(self):
         """
         Retrieves the RandomX mode property from the config data.
 
         Returns:
-            str: RandomX mode property, or "N/A" if not available.
+            str: RandomX mode property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "mode"], self._config_table_name, "randomx_mode")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "mode"), self._config_table_name, "randomx_mode")
 
     @property
+    @_memoized("config")
     def conf_randomx_1gb_pages_property(self):
         """
         Retrieves the RandomX 1GB pages property from the config data.
 
         Returns:
-            bool: RandomX 1GB pages property, or "N/A" if not available.
+            bool: RandomX 1GB pages property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "1gb-pages"], self._config_table_name, "randomx_1gb_pages")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "1gb-pages"), self._config_table_name, "randomx_1gb_pages")
 
     @property
+    @_memoized("config")
     def conf_randomx_rdmsr_property(self):
         """
         Retrieves the RandomX RDMSR property from the config data.
 
         Returns:
-            bool: RandomX RDMSR property, or "N/A" if not available.
+            bool: RandomX RDMSR property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "rdmsr"], self._config_table_name, "randomx_rdmsr")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "rdmsr"), self._config_table_name, "randomx_rdmsr")
 
     @property
+    @_memoized("config")
     def conf_randomx_wrmsr_property(self):
         """
         Retrieves the RandomX WRMSR property from the config data.
 
         Returns:
-            bool: RandomX WRMSR property, or "N/A" if not available.
+            bool: RandomX WRMSR property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "wrmsr"], self._config_table_name, "randomx_wrmsr")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "wrmsr"), self._config_table_name, "randomx_wrmsr")
 
     @property
+    @_memoized("config")
     def conf_randomx_cache_qos_property(self):
         """
         Retrieves the RandomX cache QoS property from the config data.
 
         Returns:
-            bool: RandomX cache QoS property, or "N/A" if not available.
+            bool: RandomX cache QoS property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "cache_qos"], self._config_table_name, "randomx_cache_qos")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "cache_qos"), self._config_table_name, "randomx_cache_qos")
 
     @property
+    @_memoized("config")
     def conf_randomx_numa_property(self):
         """
         Retrieves the RandomX NUMA property from the config data.
 
         Returns:
-            bool: RandomX NUMA property, or "N/A" if not available.
+            bool: RandomX NUMA property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "numa"], self._config_table_name, "randomx_numa")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "numa"), self._config_table_name, "randomx_numa")
 
     @property
+    @_memoized("config")
     def conf_randomx_scratchpad_prefetch_mode_property(self):
         """
         Retrieves the RandomX scratchpad prefetch mode property from the config data.
 
         Returns:
-            int: RandomX scratchpad prefetch mode property, or "N/A" if not available.
+            int: RandomX scratchpad prefetch mode property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["randomx", "scratchpad_prefetch_mode"], self._config_table_name, "randomx_scratchpad_prefetch_mode")
+        return self._get_data_from_cache(self._config_cache, ("randomx", "scratchpad_prefetch_mode"), self._config_table_name, "randomx_scratchpad_prefetch_mode")
 
     @property
+    @_memoized("config")
     def conf_cpu_property(self):
         """
         Retrieves the CPU property from the config data.
 
         Returns:
-            dict: CPU property, or "N/A" if not available.
+            dict: CPU property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu"], self._config_table_name, "cpu")
+        return self._get_data_from_cache(self._config_cache, ("cpu",), self._config_table_name, "cpu")
 
     @property
+    @_memoized("config")
     def conf_cpu_enabled_property(self):
         """
         Retrieves the CPU enabled property from the config data.
 
         Returns:
-            bool: CPU enabled property, or "N/A" if not available.
+            bool: CPU enabled property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "enabled"], self._config_table_name, "cpu_enabled")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "enabled"), self._config_table_name, "cpu_enabled")
 
     @property
+    @_memoized("config")
     def conf_cpu_huge_pages_property(self):
         """
         Retrieves the CPU huge pages property from the config data.
 
         Returns:
-            bool: CPU huge pages property, or "N/A" if not available.
+            bool: CPU huge pages property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "huge-pages"], self._config_table_name, "cpu_huge_pages")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "huge-pages"), self._config_table_name, "cpu_huge_pages")
 
     @property
+    @_memoized("config")
     def conf_cpu_huge_pages_jit_property(self):
         """
         Retrieves the CPU huge pages JIT property from the config data.
 
         Returns:
-            bool: CPU huge pages JIT property, or "N/A" if not available.
+            bool: CPU huge pages JIT property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "huge-pages-jit"], self._config_table_name, "cpu_huge_pages_jit")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "huge-pages-jit"), self._config_table_name, "cpu_huge_pages_jit")
 
     @property
+    @_memoized("config")
     def conf_cpu_hw_aes_property(self):
         """
         Retrieves the CPU hardware AES property from the config data.
 
         Returns:
-            bool: CPU hardware AES property, or "N/A" if not available.
+            bool: CPU hardware AES property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "hw-aes"], self._config_table_name, "cpu_hw_aes")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "hw-aes"), self._config_table_name, "cpu_hw_aes")
 
     @property
+    @_memoized("config")
     def conf_cpu_priority_property(self):
         """
         Retrieves the CPU priority property from the config data.
 
         Returns:
-            int: CPU priority property, or "N/A" if not available.
+            int: CPU priority property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "priority"], self._config_table_name, "cpu_priority")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "priority"), self._config_table_name, "cpu_priority")
 
     @property
+    @_memoized("config")
     def conf_cpu_memory_pool_property(self):
         """
         Retrieves the CPU memory pool property from the config data.
 
         Returns:
-            bool: CPU memory pool property, or "N/A" if not available.
+            bool: CPU memory pool property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "memory-pool"], self._config_table_name, "cpu_memory_pool")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "memory-pool"), self._config_table_name, "cpu_memory_pool")
 
     @property
+    @_memoized("config")
     def conf_cpu_yield_property(self):
         """
         Retrieves the CPU yield property from the config data.
 
         Returns:
-            bool: CPU yield property, or "N/A" if not available.
+            bool: CPU yield property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "yield"], self._config_table_name, "cpu_yield")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "yield"), self._config_table_name, "cpu_yield")
 
     @property
+    @_memoized("config")
     def conf_cpu_max_threads_hint_property(self):
         """
         Retrieves the CPU max threads hint property from the config data.
 
         Returns:
-            int: CPU max threads hint property, or "N/A" if not available.
+            int: CPU max threads hint property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "max-threads-hint"], self._config_table_name, "cpu_max_threads_hint")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "max-threads-hint"), self._config_table_name, "cpu_max_threads_hint")
 
     @property
+    @_memoized("config")
     def conf_cpu_asm_property(self):
         """
         Retrieves the CPU ASM property from the config data.
 
         Returns:
-            bool: CPU ASM property, or "N/A" if not available.
+            bool: CPU ASM property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "asm"], self._config_table_name, "cpu_asm")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "asm"), self._config_table_name, "cpu_asm")
 
     @property
+    @_memoized("config")
     def conf_cpu_argon2_impl_property(self):
         """
         Retrieves the CPU Argon2 implementation property from the config data.
 
         Returns:
-            str: CPU Argon2 implementation property, or "N/A" if not available.
+            str: CPU Argon2 implementation property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cpu", "argon2-impl"], self._config_table_name, "cpu_argon2_impl")
+        return self._get_data_from_cache(self._config_cache, ("cpu", "argon2-impl"), self._config_table_name, "cpu_argon2_impl")
 
     @property
+    @_memoized("config")
     def conf_opencl_property(self):
         """
         Retrieves the OpenCL property from the config data.
 
         Returns:
-            dict: OpenCL property, or "N/A" if not available.
+            dict: OpenCL property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl"], self._config_table_name, "opencl")
+        return self._get_data_from_cache(self._config_cache, ("opencl",), self._config_table_name, "opencl")
 
     @property
+    @_memoized("config")
     def conf_opencl_enabled_property(self):
         """
         Retrieves the OpenCL enabled property from the config data.
 
         Returns:
-            bool: OpenCL enabled property, or "N/A" if not available.
+            bool: OpenCL enabled property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl", "enabled"], self._config_table_name, "opencl_enabled")
+        return self._get_data_from_cache(self._config_cache, ("opencl", "enabled"), self._config_table_name, "opencl_enabled")
 
     @property
+    @_memoized("config")
     def conf_opencl_cache_property(self):
         """
         Retrieves the OpenCL cache property from the config data.
 
         Returns:
-            bool: OpenCL cache property, or "N/A" if not available.
+            bool: OpenCL cache property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl", "cache"], self._config_table_name, "opencl_cache")
+        return self._get_data_from_cache(self._config_cache, ("opencl", "cache"), self._config_table_name, "opencl_cache")
 
     @property
+    @_memoized("config")
     def conf_opencl_loader_property(self):
         """
         Retrieves the OpenCL loader property from the config data.
 
         Returns:
-            str: OpenCL loader property, or "N/A" if not available.
+            str: OpenCL loader property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl", "loader"], self._config_table_name, "opencl_loader")
+        return self._get_data_from_cache(self._config_cache, ("opencl", "loader"), self._config_table_name, "opencl_loader")
 
     @property
+    @_memoized("config")
     def conf_opencl_platform_property(self):
         """
         Retrieves the OpenCL platform property from the config data.
 
         Returns:
-            str: OpenCL platform property, or "N/A" if not available.
+            str: OpenCL platform property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl", "platform"], self._config_table_name, "opencl_platform")
+        return self._get_data_from_cache(self._config_cache, ("opencl", "platform"), self._config_table_name, "opencl_platform")
 
     @property
+    @_memoized("config")
     def conf_opencl_adl_property(self):
         """
         Retrieves the OpenCL ADL property from the config data.
 
         Returns:
-            bool: OpenCL ADL property, or "N/A" if not available.
+            bool: OpenCL ADL property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["opencl", "adl"], self._config_table_name, "opencl_adl")
+        return self._get_data_from_cache(self._config_cache, ("opencl", "adl"), self._config_table_name, "opencl_adl")
 
     @property
+    @_memoized("config")
     def conf_cuda_property(self):
         """
         Retrieves the CUDA from the config data.
 
         Returns:
-            dict: CUDA, or "N/A" if not available.
+            dict: CUDA, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cuda"], self._config_table_name, "cuda")
+        return self._get_data_from_cache(self._config_cache, ("cuda",), self._config_table_name, "cuda")
 
     @property
+    @_memoized("config")
     def conf_cuda_enabled_property(self):
         """
         Retrieves the CUDA enabled status from the config data.
 
         Returns:
-            bool: CUDA enabled status, or "N/A" if not available.
+            bool: CUDA enabled status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cuda", "enabled"], self._config_table_name, "cuda_enabled")
+        return self._get_data_from_cache(self._config_cache, ("cuda", "enabled"), self._config_table_name, "cuda_enabled")
 
     @property
+    @_memoized("config")
     def conf_cuda_loader_property(self):
         """
         Retrieves the CUDA loader from the config data.
 
         Returns:
-            str: CUDA loader, or "N/A" if not available.
+            str: CUDA loader, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cuda", "loader"], self._config_table_name, "cuda_loader")
+        return self._get_data_from_cache(self._config_cache, ("cuda", "loader"), self._config_table_name, "cuda_loader")
 
     @property
+    @_memoized("config")
     def conf_cuda_nvml_property(self):
         """
         Retrieves the CUDA NVML from the config data.
 
         Returns:
-            bool: CUDA NVML, or "N/A" if not available.
+            bool: CUDA NVML, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["cuda", "nvml"], self._config_table_name, "cuda_nvml")
+        return self._get_data_from_cache(self._config_cache, ("cuda", "nvml"), self._config_table_name, "cuda_nvml")
 
     @property
+    @_memoized("config")
     def conf_log_file_property(self):
         """
         Retrieves the log file from the config data.
 
         Returns:
-            str: Log file, or "N/A" if not available.
+            str: Log file, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["log-file"], self._config_table_name, "log_file")
+        return self._get_data_from_cache(self._config_cache, ("log-file",), self._config_table_name, "log_file")
 
     @property
+    @_memoized("config")
     def conf_donate_level_property(self):
         """
         Retrieves the donate level from the config data.
 
         Returns:
-            int: Donate level, or "N/A" if not available.
+            int: Donate level, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["donate-level"], self._config_table_name, "donate_level")
+        return self._get_data_from_cache(self._config_cache, ("donate-level",), self._config_table_name, "donate_level")
 
     @property
+    @_memoized("config")
     def conf_donate_over_proxy_property(self):
         """
         Retrieves the donate over proxy from the config data.
 
         Returns:
-            int: Donate over proxy, or "N/A" if not available.
+            int: Donate over proxy, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["donate-over-proxy"], self._config_table_name, "donate_over_proxy")
+        return self._get_data_from_cache(self._config_cache, ("donate-over-proxy",), self._config_table_name, "donate_over_proxy")
 
     @property
+    @_memoized("config")
     def conf_pools_property(self):
         """
         Retrieves the pools from the config data.
 
         Returns:
-            list: Pools, or "N/A" if not available.
+            list: Pools, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools")
+        return self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
 
     @property
+    @_memoized("config")
     def conf_pools_algo_property(self):
         """
         Retrieves the pools algorithm from the config data.
 
         Returns:
-            list: Pools algorithm, or "N/A" if not available.
+            list: Pools algorithm, or None if not available.
         """
-        algos = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                algos.append(i["algo"])
-        except KeyError:
-            return "N/A"
-        return algos
+            return [i["algo"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_coin_property(self):
         """
         Retrieves the pools coin from the config data.
 
         Returns:
-            list: Pools coin, or "N/A" if not available.
+            list: Pools coin, or None if not available.
         """
-        coins = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                coins.append(i["coin"])
-        except KeyError:
-            return "N/A"
-        return coins
+            return [i["coin"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_url_property(self):
         """
         Retrieves the pools URL from the config data.
 
         Returns:
-            list: Pools URL, or "N/A" if not available.
+            list: Pools URL, or None if not available.
         """
-        urls = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                urls.append(i["url"])
-        except KeyError:
-            return "N/A"
-        return urls
+            return [i["url"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_user_property(self):
         """
         Retrieves the pools user from the config data.
 
         Returns:
-            list: Pools user, or "N/A" if not available.
+            list: Pools user, or None if not available.
         """
-        users = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                users.append(i["user"])
-        except KeyError:
-            return "N/A"
-        return users
+            return [i["user"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_pass_property(self):
         """
         Retrieves the pools password from the config data.
 
         Returns:
-            list: Pools password, or "N/A" if not available.
+            list: Pools password, or None if not available.
         """
-        passwords = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                passwords.append(i["pass"])
-        except KeyError:
-            return "N/A"
-        return passwords
+            return [i["pass"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_rig_id_property(self):
         """
         Retrieves the pools rig ID from the config data.
 
         Returns:
-            list: Pools rig ID, or "N/A" if not available.
+            list: Pools rig ID, or None if not available.
         """
-        rig_ids = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                rig_ids.append(i["rig-id"])
-        except KeyError:
-            return "N/A"
-        return rig_ids
+            return [i["rig-id"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_nicehash_property(self):
         """
         Retrieves the pools NiceHash status from the config data.
 
         Returns:
-            list: Pools NiceHash status, or "N/A" if not available.
+            list: Pools NiceHash status, or None if not available.
         """
-        nicehash_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                nicehash_statuses.append(i["nicehash"])
-        except KeyError:
-            return "N/A"
-        return nicehash_statuses
+            return [i["nicehash"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_keepalive_property(self):
         """
         Retrieves the pools keepalive status from the config data.
 
         Returns:
-            list: Pools keepalive status, or "N/A" if not available.
+            list: Pools keepalive status, or None if not available.
         """
-        keepalive_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                keepalive_statuses.append(i["keepalive"])
-        except KeyError:
-            return "N/A"
-        return keepalive_statuses
+            return [i["keepalive"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_enabled_property(self):
         """
         Retrieves the pools enabled status from the config data.
 
         Returns:
-            list: Pools enabled status, or "N/A" if not available.
+            list: Pools enabled status, or None if not available.
         """
-        enabled_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                enabled_statuses.append(i["enabled"])
-        except KeyError:
-            return "N/A"
-        return enabled_statuses
+            return [i["enabled"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_tls_property(self):
         """
         Retrieves the pools TLS status from the config data.
 
         Returns:
-            list: Pools TLS status, or "N/A" if not available.
+            list: Pools TLS status, or None if not available.
         """
-        tls_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                tls_statuses.append(i["tls"])
-        except KeyError:
-            return "N/A"
-        return tls_statuses
+            return [i["tls"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_sni_property(self):
         """
         Retrieves the pools SNI status from the config data.
 
         Returns:
-            list: Pools SNI status, or "N/A" if not available.
+            list: Pools SNI status, or None if not available.
         """
-        sni_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                sni_statuses.append(i["sni"])
-        except KeyError:
-            return "N/A"
-        return sni_statuses
+            return [i["sni"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_spend_secret_key_property(self):
         """
         Retrieves the pools spend secret key status from the config data.
 
         Returns:
-            list: Pools spend secret key status, or "N/A" if not available.
+            list: Pools spend secret key status, or None if not available.
         """
-        spend_secret_key_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                spend_secret_key_statuses.append(i["spend-secret-key"])
-        except KeyError:
-            return "N/A"
-        return spend_secret_key_statuses
+            return [i["spend-secret-key"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_tls_fingerprint_property(self):
         """
         Retrieves the pools TLS fingerprint from the config data.
 
         Returns:
-            list: Pools TLS fingerprint, or "N/A" if not available.
+            list: Pools TLS fingerprint, or None if not available.
         """
-        tls_fingerprints = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                tls_fingerprints.append(i["tls-fingerprint"])
-        except KeyError:
-            return "N/A"
-        return tls_fingerprints
+            return [i["tls-fingerprint"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_daemon_property(self):
         """
         Retrieves the pools daemon status from the config data.
 
         Returns:
-            list: Pools daemon status, or "N/A" if not available.
+            list: Pools daemon status, or None if not available.
         """
-        daemon_statuses = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                daemon_statuses.append(i["daemon"])
-        except KeyError:
-            return "N/A"
-        return daemon_statuses
+            return [i["daemon"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_daemon_poll_interval_property(self):
         """
         Retrieves the pools daemon poll interval from the config data.
 
         Returns:
-            list: Pools daemon poll interval, or "N/A" if not available.
+            list: Pools daemon poll interval, or None if not available.
         """
-        daemon_poll_intervals = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                daemon_poll_intervals.append(i["daemon-poll-interval"])
-        except KeyError:
-            return "N/A"
-        return daemon_poll_intervals
+            return [i["daemon-poll-interval"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_daemon_job_timeout_property(self):
         """
         Retrieves the pools daemon job timeout from the config data.
 
         Returns:
-            list: Pools daemon job timeout, or "N/A" if not available.
+            list: Pools daemon job timeout, or None if not available.
         """
-        daemon_job_timeouts = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                daemon_job_timeouts.append(i["daemon-job-timeout"])
-        except KeyError:
-            return "N/A"
-        return daemon_job_timeouts
+            return [i["daemon-job-timeout"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_daemon_zmq_port_property(self):
         """
         Retrieves the pools daemon ZMQ port from the config data.
 
         Returns:
-            list: Pools daemon ZMQ port, or "N/A" if not available.
+            list: Pools daemon ZMQ port, or None if not available.
         """
-        daemon_zmq_ports = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                daemon_zmq_ports.append(i["daemon-zmq-port"])
-        except KeyError:
-            return "N/A"
-        return daemon_zmq_ports
+            return [i["daemon-zmq-port"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_socks5_property(self):
         """
         Retrieves the pools SOCKS5 from the config data.
 
         Returns:
-            list: Pools SOCKS5, or "N/A" if not available.
+            list: Pools SOCKS5, or None if not available.
         """
-        socks5_values = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                socks5_values.append(i["socks5"])
-        except KeyError:
-            return "N/A"
-        return socks5_values
+            return [i["socks5"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_self_select_property(self):
         """
         Retrieves the pools self-select from the config data.
 
         Returns:
-            list: Pools self-select, or "N/A" if not available.
+            list: Pools self-select, or None if not available.
         """
-        self_selects = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                self_selects.append(i["self-select"])
-        except KeyError:
-            return "N/A"
-        return self_selects
+            return [i["self-select"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_pools_submit_to_origin_property(self):
         """
         Retrieves the pools submit to origin status from the config data.
 
         Returns:
-            list: Pools submit to origin status, or "N/A" if not available.
+            list: Pools submit to origin status, or None if not available.
         """
-        submit_to_origins = []
+        pools = self._get_data_from_cache(self._config_cache, ("pools",), self._config_table_name, "pools")
+        if not isinstance(pools, list):
+            return None
         try:
-            for i in self._get_data_from_cache(self._config_cache, ["pools"], self._config_table_name, "pools"):
-                submit_to_origins.append(i["submit-to-origin"])
-        except KeyError:
-            return "N/A"
-        return submit_to_origins
+            return [i["submit-to-origin"] for i in pools]
+        except (KeyError, TypeError):
+            return None
 
     @property
+    @_memoized("config")
     def conf_retries_property(self):
         """
         Retrieves the retries from the config data.
 
         Returns:
-            int: Retries, or "N/A" if not available.
+            int: Retries, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["retries"], self._config_table_name, "retries")
+        return self._get_data_from_cache(self._config_cache, ("retries",), self._config_table_name, "retries")
 
     @property
+    @_memoized("config")
     def conf_retry_pause_property(self):
         """
         Retrieves the retry pause from the config data.
 
         Returns:
-            int: Retry pause, or "N/A" if not available.
+            int: Retry pause, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["retry-pause"], self._config_table_name, "retry_pause")
+        return self._get_data_from_cache(self._config_cache, ("retry-pause",), self._config_table_name, "retry_pause")
 
     @property
+    @_memoized("config")
     def conf_print_time_property(self):
         """
         Retrieves the print time from the config data.
 
         Returns:
-            int: Print time, or "N/A" if not available.
+            int: Print time, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["print-time"], self._config_table_name, "print_time")
+        return self._get_data_from_cache(self._config_cache, ("print-time",), self._config_table_name, "print_time")
 
     @property
+    @_memoized("config")
     def conf_health_print_time_property(self):
         """
         Retrieves the health print time from the config data.
 
         Returns:
-            int: Health print time, or "N/A" if not available.
+            int: Health print time, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["health-print-time"], self._config_table_name, "health_print_time")
+        return self._get_data_from_cache(self._config_cache, ("health-print-time",), self._config_table_name, "health_print_time")
 
     @property
+    @_memoized("config")
     def conf_dmi_property(self):
         """
         Retrieves the DMI status from the config data.
 
         Returns:
-            bool: DMI status, or "N/A" if not available.
+            bool: DMI status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["dmi"], self._config_table_name, "dmi")
+        return self._get_data_from_cache(self._config_cache, ("dmi",), self._config_table_name, "dmi")
 
     @property
+    @_memoized("config")
     def conf_syslog_property(self):
         """
         Retrieves the syslog status from the config data.
 
         Returns:
-            bool: Syslog status, or "N/A" if not available.
+            bool: Syslog status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["syslog"], self._config_table_name, "syslog")
+        return self._get_data_from_cache(self._config_cache, ("syslog",), self._config_table_name, "syslog")
 
     @property
+    @_memoized("config")
     def conf_tls_property(self):
         """
         Retrieves the TLS property from the config data.
 
         Returns:
-            dict: TLS property, or "N/A" if not available.
+            dict: TLS property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls"], self._config_table_name, "tls")
+        return self._get_data_from_cache(self._config_cache, ("tls",), self._config_table_name, "tls")
 
     @property
+    @_memoized("config")
     def conf_tls_enabled_property(self):
         """
         Retrieves the TLS enabled status from the config data.
 
         Returns:
-            bool: TLS enabled status, or "N/A" if not available.
+            bool: TLS enabled status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "enabled"], self._config_table_name, "tls_enabled")
+        return self._get_data_from_cache(self._config_cache, ("tls", "enabled"), self._config_table_name, "tls_enabled")
 
     @property
+    @_memoized("config")
     def conf_tls_protocols_property(self):
         """
         Retrieves the TLS protocols from the config data.
 
         Returns:
-            str: TLS protocols, or "N/A" if not available.
+            str: TLS protocols, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "protocols"], self._config_table_name, "tls_protocols")
+        return self._get_data_from_cache(self._config_cache, ("tls", "protocols"), self._config_table_name, "tls_protocols")
 
     @property
+    @_memoized("config")
     def conf_tls_cert_property(self):
         """
         Retrieves the TLS certificate from the config data.
 
         Returns:
-            str: TLS certificate, or "N/A" if not available.
+            str: TLS certificate, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "cert"], self._config_table_name, "tls_cert")
+        return self._get_data_from_cache(self._config_cache, ("tls", "cert"), self._config_table_name, "tls_cert")
 
     @property
+    @_memoized("config")
     def conf_tls_cert_key_property(self):
         """
         Retrieves the TLS certificate key from the config data.
 
         Returns:
-            str: TLS certificate key, or "N/A" if not available.
+            str: TLS certificate key, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "cert_key"], self._config_table_name, "tls_cert_key")
+        return self._get_data_from_cache(self._config_cache, ("tls", "cert_key"), self._config_table_name, "tls_cert_key")
 
     @property
+    @_memoized("config")
     def conf_tls_ciphers_property(self):
         """
         Retrieves the TLS ciphers from the config data.
 
         Returns:
-            str: TLS ciphers, or "N/A" if not available.
+            str: TLS ciphers, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "ciphers"], self._config_table_name, "tls_ciphers")
+        return self._get_data_from_cache(self._config_cache, ("tls", "ciphers"), self._config_table_name, "tls_ciphers")
 
     @property
+    @_memoized("config")
     def conf_tls_ciphersuites_property(self):
         """
         Retrieves the TLS ciphersuites from the config data.
 
         Returns:
-            str: TLS ciphersuites, or "N/A" if not available.
+            str: TLS ciphersuites, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "ciphersuites"], self._config_table_name, "tls_ciphersuites")
+        return self._get_data_from_cache(self._config_cache, ("tls", "ciphersuites"), self._config_table_name, "tls_ciphersuites")
 
     @property
+    @_memoized("config")
     def conf_tls_dhparam_property(self):
         """
         Retrieves the TLS DH parameter from the config data.
 
         Returns:
-            str: TLS DH parameter, or "N/A" if not available.
+            str: TLS DH parameter, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["tls", "dhparam"], self._config_table_name, "tls_dhparam")
+        return self._get_data_from_cache(self._config_cache, ("tls", "dhparam"), self._config_table_name, "tls_dhparam")
 
     @property
+    @_memoized("config")
     def conf_dns_property(self):
         """
         Retrieves the DNS property from the config data.
 
         Returns:
-            dict: DNS property, or "N/A" if not available.
+            dict: DNS property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["dns"], self._config_table_name, "dns")
+        return self._get_data_from_cache(self._config_cache, ("dns",), self._config_table_name, "dns")
 
     @property
+    @_memoized("config")
     def conf_dns_ipv6_property(self):
         """
         Retrieves the DNS IPv6 status from the config data.
 
         Returns:
-            bool: DNS IPv6 status, or "N/A" if not available.
+            bool: DNS IPv6 status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["dns", "ipv6"], self._config_table_name, "dns_ipv6")
+        return self._get_data_from_cache(self._config_cache, ("dns", "ipv6"), self._config_table_name, "dns_ipv6")
 
     @property
+    @_memoized("config")
     def conf_dns_ttl_property(self):
         """
         Retrieves the DNS TTL from the config data.
 
         Returns:
-            int: DNS TTL, or "N/A" if not available.
+            int: DNS TTL, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["dns", "ttl"], self._config_table_name, "dns_ttl")
+        return self._get_data_from_cache(self._config_cache, ("dns", "ttl"), self._config_table_name, "dns_ttl")
 
     @property
+    @_memoized("config")
     def conf_user_agent_property(self):
         """
         Retrieves the user agent from the config data.
 
         Returns:
-            str: User agent, or "N/A" if not available.
+            str: User agent, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["user-agent"], self._config_table_name, "user_agent")
+        return self._get_data_from_cache(self._config_cache, ("user-agent",), self._config_table_name, "user_agent")
 
     @property
+    @_memoized("config")
     def conf_verbose_property(self):
         """
         Retrieves the verbose level from the config data.
 
         Returns:
-            int: Verbose level, or "N/A" if not available.
+            int: Verbose level, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["verbose"], self._config_table_name, "verbose")
+        return self._get_data_from_cache(self._config_cache, ("verbose",), self._config_table_name, "verbose")
 
     @property
+    @_memoized("config")
     def conf_watch_property(self):
         """
         Retrieves the watch status from the config data.
 
         Returns:
-            bool: Watch status, or "N/A" if not available.
+            bool: Watch status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["watch"], self._config_table_name, "watch")
+        return self._get_data_from_cache(self._config_cache, ("watch",), self._config_table_name, "watch")
 
     @property
+    @_memoized("config")
     def conf_rebench_algo_property(self):
         """
         Retrieves the rebench algorithm status from the config data.
 
         Returns:
-            bool: Rebench algorithm status, or "N/A" if not available.
+            bool: Rebench algorithm status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["rebench-algo"], self._config_table_name, "rebench_algo")
+        return self._get_data_from_cache(self._config_cache, ("rebench-algo",), self._config_table_name, "rebench_algo")
 
     @property
+    @_memoized("config")
     def conf_bench_algo_time_property(self):
         """
         Retrieves the bench algorithm time from the config data.
 
         Returns:
-            int: Bench algorithm time, or "N/A" if not available.
+            int: Bench algorithm time, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["bench-algo-time"], self._config_table_name, "bench_algo_time")
+        return self._get_data_from_cache(self._config_cache, ("bench-algo-time",), self._config_table_name, "bench_algo_time")
 
     @property
+    @_memoized("config")
     def conf_pause_on_battery_property(self):
         """
         Retrieves the pause on battery status from the config data.
 
         Returns:
-            bool: Pause on battery status, or "N/A" if not available.
+            bool: Pause on battery status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["pause-on-battery"], self._config_table_name, "pause_on_battery")
+        return self._get_data_from_cache(self._config_cache, ("pause-on-battery",), self._config_table_name, "pause_on_battery")
 
     @property
+    @_memoized("config")
     def conf_pause_on_active_property(self):
         """
         Retrieves the pause on active status from the config data.
 
         Returns:
-            bool: Pause on active status, or "N/A" if not available.
+            bool: Pause on active status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["pause-on-active"], self._config_table_name, "pause_on_active")
+        return self._get_data_from_cache(self._config_cache, ("pause-on-active",), self._config_table_name, "pause_on_active")
     
     @property
+    @_memoized("config")
     def conf_benchmark_property(self):
         """
         Retrieves the benchmark property from the config data.
 
         Returns:
-            dict: Benchmark property, or "N/A" if not available.
+            dict: Benchmark property, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark"], self._config_table_name, "benchmark")
+        return self._get_data_from_cache(self._config_cache, ("benchmark",), self._config_table_name, "benchmark")
     
     @property
+    @_memoized("config")
     def conf_benchmark_size_property(self):
         """
         Retrieves the benchmark size from the config data.
 
         Returns:
-            str: Benchmark size, or "N/A" if not available.
+            str: Benchmark size, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "size"], self._config_table_name, "benchmark_size")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "size"), self._config_table_name, "benchmark_size")
     
     @property
+    @_memoized("config")
     def conf_benchmark_algo_property(self):
         """
         Retrieves the benchmark algorithm from the config data.
 
         Returns:
-            str: Benchmark algorithm, or "N/A" if not available.
+            str: Benchmark algorithm, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "algo"], self._config_table_name, "benchmark_algo")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "algo"), self._config_table_name, "benchmark_algo")
     
     @property
+    @_memoized("config")
     def conf_benchmark_submit_property(self):
         """
         Retrieves the benchmark submit status from the config data.
 
         Returns:
-            bool: Benchmark submit status, or "N/A" if not available.
+            bool: Benchmark submit status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "submit"], self._config_table_name, "benchmark_submit")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "submit"), self._config_table_name, "benchmark_submit")
     
     @property
+    @_memoized("config")
     def conf_benchmark_verify_property(self):
         """
         Retrieves the benchmark verify status from the config data.
 
         Returns:
-            str: Benchmark verify status, or "N/A" if not available.
+            str: Benchmark verify status, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "verify"], self._config_table_name, "benchmark_verify")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "verify"), self._config_table_name, "benchmark_verify")
     
     @property
+    @_memoized("config")
     def conf_benchmark_seed_property(self):
         """
         Retrieves the benchmark seed from the config data.
 
         Returns:
-            str: Benchmark seed, or "N/A" if not available.
+            str: Benchmark seed, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "seed"], self._config_table_name, "benchmark_seed")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "seed"), self._config_table_name, "benchmark_seed")
     
     @property
+    @_memoized("config")
     def conf_benchmark_hash_property(self):
         """
         Retrieves the benchmark hash from the config data.
 
         Returns:
-            str: Benchmark hash, or "N/A" if not available.
+            str: Benchmark hash, or None if not available.
         """
-        return self._get_data_from_cache(self._config_cache, ["benchmark", "hash"], self._config_table_name, "benchmark_hash")
+        return self._get_data_from_cache(self._config_cache, ("benchmark", "hash"), self._config_table_name, "benchmark_hash")
 
 # Define the public interface of the module
 __all__ = ["XMRigAPI"]
\ No newline at end of file
@@ -15,7 +15,7 @@ from sqlalchemy.orm import sessionmaker
 from xmrig.exceptions import XMRigDatabaseError
 from xmrig.models import Base, Summary, Config, Backends
 from datetime import datetime
-import traceback, logging
+import logging
 
 log = logging.getLogger("xmrig.db")
 
@@ -56,7 +56,7 @@ class XMRigDatabase:
                 cls._engines[db_url] = engine
             return cls._engines[db_url]
         except Exception as e:
-            raise XMRigDatabaseError(e, traceback.format_exc(), f"An error occurred initializing the database:") from e
+            raise XMRigDatabaseError(e, message = f"An error occurred initializing the database:") from e
     
     @classmethod
     def _get_db_session(cls, db_url):
@@ -77,7 +77,7 @@ class XMRigDatabase:
             Session = sessionmaker(bind=engine)
             return Session()
         except KeyError as e:
-            raise XMRigDatabaseError(e, traceback.format_exc(), f"Database engine for '{db_url}' does not exist. Please initialize the database first.") from e
+            raise XMRigDatabaseError(e, message = f"Database engine for '{db_url}' does not exist. Please initialize the database first.") from e
     
     @classmethod
     def _insert_data_to_db(cls, json_data, miner, endpoint, db_url):
@@ -93,21 +93,40 @@ class XMRigDatabase:
         Raises:
             XMRigDatabaseError: If an error occurs while inserting data into the database.
         """
+        cls._insert_many_to_db([(json_data, endpoint)], miner, db_url)
+
+    @classmethod
+    def _insert_many_to_db(cls, items, miner, db_url):
+        """
+        Inserts JSON data from several endpoints into their database tables in a single transaction.
+
+        Args:
+            items (list): Tuples of the JSON data to insert and the endpoint from which it was retrieved.
+            miner (str): Name of the miner.
+            db_url (str): Database URL for creating the engine.
+
+        Raises:
+            XMRigDatabaseError: If an error occurs while inserting data into the database.
+        """
+        session = None
         try:
             session = cls._get_db_session(db_url)
             cur_time = datetime.now()
-            if endpoint == "summary":
-                cls._insert_summary_data(session, json_data, miner, cur_time)
-            elif endpoint == "config":
-                cls._insert_config_data(session, json_data, miner, cur_time)
-            elif endpoint == "backends":
-                cls._insert_backends_data(session, json_data, miner, cur_time)
+            for json_data, endpoint in items:
+                if endpoint == "summary":
+                    cls._insert_summary_data(session, json_data, miner, cur_time)
+                elif endpoint == "config":
+                    cls._insert_config_data(session, json_data, miner, cur_time)
+                elif endpoint == "backends":
+                    cls._insert_backends_data(session, json_data, miner, cur_time)
             session.commit()
         except Exception as e:
-            session.rollback()
-            raise XMRigDatabaseError(e, traceback.format_exc(), f"An error occurred inserting data to the database:") from e
+            if session is not None:
+                session.rollback()
+            raise XMRigDatabaseError(e, message = f"An error occurred inserting data to the database:") from e
         finally:
-            session.close()
+            if session is not None:
+                session.close()
 
     @classmethod
     def _insert_summary_data(cls, session, json_data, miner, cur_time):
@@ -412,12 +431,13 @@ class XMRigDatabase:
             limit (int, optional): Limit the number of rows retrieved. Defaults to 1.
 
         Returns:
-            list: List of dictionaries containing the retrieved data or "N/A" if no data is found.
+            list: List of dictionaries containing the retrieved data, or an empty list if no data is found.
 
         Raises:
             XMRigDatabaseError: If an error occurs while retrieving data from the database.
         """
-        data = "N/A"
+        data = []
+        session = None
         try:
             session = cls._get_db_session(db_url)
 
@@ -450,14 +470,12 @@ class XMRigDatabase:
 
             # Execute the query and fetch results
             results = query.all()
-            if results:
-                data = [result._asdict() for result in results]
-            else:
-                data = "N/A"
+            data = [result._asdict() for result in results]
         except Exception as e:
-            raise XMRigDatabaseError(e, traceback.format_exc(), f"An error occurred retrieving data from the database:") from e
+            raise XMRigDatabaseError(e, message = f"An error occurred retrieving data from the database:") from e
         finally:
-            session.close()
+            if session is not None:
+                session.close()
         return data
 
     @classmethod
@@ -472,6 +490,7 @@ class XMRigDatabase:
         Raises:
             XMRigDatabaseError: If an error occurs while deleting the miner data from the database.
         """
+        session = None
         try:
             session = cls._get_db_session(db_url)
 
@@ -481,10 +500,12 @@ class XMRigDatabase:
             session.commit()
             log.debug(f"All data for miner '{miner_name}' has been deleted from the database")
         except Exception as e:
-            session.rollback()
-            raise XMRigDatabaseError(e, traceback.format_exc(), f"An error occurred deleting miner '{miner_name}' data from the database:") from e
+            if session is not None:
+                session.rollback()
+            raise XMRigDatabaseError(e, message = f"An error occurred deleting miner '{miner_name}' data from the database:") from e
         finally:
-            session.close()
+            if session is not None:
+                session.close()
 
 # Define the public interface of the module
 __all__ = ["XMRigDatabase"]
\ No newline at end of file
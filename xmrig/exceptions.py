@@ -25,7 +25,8 @@ class XMRigAPIError(Exception):
 
         Args:
             error (str, optional): Specific error message. Defaults to None.
-            traceback (str, optional): Traceback of the error. Defaults to None.
+            traceback (str, optional): Traceback of the error, appended to the message. Defaults to None, raise with 
+                `from` to keep the original traceback on the exception chain instead.
             message (str): Error message explaining the API issue. Defaults to a generic API error message.
         """
         error_message = f" {error}" if error else ""
@@ -0,0 +1,58 @@
+"""
+XMRig Logger module.
+
+This module provides the logging_setup helper to configure logging for applications using the library.
+It includes functionalities for:
+
+- Logging to a file and the console.
+- Writing log records on a background thread so logging calls only enqueue the record.
+- Configuring the handlers only once, no matter how many times it is called.
+"""
+
+import atexit, logging, logging.handlers, queue
+
+_listener = None
+
+def _stop_listener():
+    """
+    Stops the queue listener, flushing any queued log records.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def logging_setup(name = None, level = logging.INFO, file = "app.log"):
+    """
+    Configures the root logger to log to a file and the console and returns the requested logger.
+
+    Log records are placed on a queue and written by a background listener, which is stopped at exit to flush
+    any queued records. The handlers are only installed on the first call, later calls return the logger
+    without opening the log file or adding handlers again.
+
+    Args:
+        name (str, optional): Name of the logger to return. Defaults to None for the root logger.
+        level (int, optional): Log level for the entire application, use `logging.DEBUG` to log all responses. Defaults to `logging.INFO`.
+        file (str, optional): Path of the log file. Defaults to "app.log".
+
+    Returns:
+        logging.Logger: The requested logger.
+    """
+    global _listener
+    if _listener is None:
+        log_queue = queue.SimpleQueue()
+        formatter = logging.Formatter("[%(asctime)s - %(name)s] - %(levelname)s - %(message)s")
+        file_handler = logging.FileHandler(file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        _listener.start()
+        atexit.register(_stop_listener)
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logging.getLogger(name)
+
+# Define the public interface of the module
+__all__ = ["logging_setup"]
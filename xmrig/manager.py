@@ -9,37 +9,49 @@ It includes functionalities for:
 - Retrieving a specific miner's API instance.
 - Performing actions (e.g., pause, resume, stop) on all managed miners.
 - Updating all miners' cached data.
+- Totalling the hashrate of all miners.
 - Listing all managed miners.
+- Closing all managed miners and the manager's thread pool.
 - Deleting all miner-related data from the database.
 """
-import traceback, logging
+import logging, asyncio, functools
+from concurrent.futures import ThreadPoolExecutor
 from xmrig.api import XMRigAPI
 from xmrig.exceptions import XMRigManagerError
 from xmrig.db import XMRigDatabase
 
 log = logging.getLogger("xmrig.manager")
 
+_DEFAULT_DB_URL = "sqlite:///xmrig-api.db"
+
 class XMRigManager:
     """
     A class to manage multiple XMRig miners via their APIs.
 
     Attributes:
         _miners (dict): A dictionary to store miner API instances.
+        _miner_names (tuple): Names of the managed miners, rebuilt whenever a miner is added, removed or renamed.
         _api_factory (XMRigAPI): Factory for creating XMRigAPI instances.
         _db_url (str): Database URL for storing miner data.
+        _pool (ThreadPoolExecutor): Thread pool used to contact all miners concurrently.
     """
 
-    def __init__(self, api_factory=XMRigAPI, db_url = "sqlite:///xmrig-api.db"):
+    __slots__ = ("_miners", "_miner_names", "_api_factory", "_db_url", "_pool")
+
+    def __init__(self, api_factory=XMRigAPI, db_url = _DEFAULT_DB_URL, max_workers = 32):
         """
         Initializes the manager with an empty collection of miners.
 
         Args:
             api_factory (XMRigAPI): Factory for creating XMRigAPI instances.
             db_url (str): Database URL for storing miner data.
+            max_workers (int, optional): Maximum number of miners contacted concurrently. Defaults to 32.
         """
         self._miners = {}
+        self._miner_names = ()
         self._api_factory = api_factory
         self._db_url = db_url
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="xmrig-manager")
         if self._db_url is not None:
             XMRigDatabase._init_db(self._db_url)
 
@@ -54,17 +66,29 @@ class XMRigManager:
             access_token (str, optional): Access token for authorization. Defaults to None.
             tls_enabled (bool, optional): TLS status of the miner/API. Defaults to False.
 
+        Adding a miner which already exists with identical connection details is a no-op and returns the 
+        existing instance, so repeated calls can share its connection pool and cached data.
+
+        Returns:
+            XMRigAPI: The API instance for the added miner.
+
         Raises:
             XMRigManagerError: If an error occurs while adding the miner.
         """
         try:
             if miner_name in self._miners:
+                existing = self._miners[miner_name]
+                if (existing._ip, existing._port, existing._access_token, existing._tls_enabled) == (ip, port, access_token, tls_enabled):
+                    log.debug(f"Miner called '{miner_name}' already added to manager.")
+                    return existing
                 raise ValueError(f"Miner with name '{miner_name}' already exists.")
             # Use the injected factory to create the API instance
             self._miners[miner_name] = self._api_factory(miner_name, ip, port, access_token, tls_enabled, self._db_url)
+            self._miner_names = tuple(self._miners)
             log.info(f"Miner called '{miner_name}' added to manager.")
+            return self._miners[miner_name]
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred adding miner '{miner_name}':") from e
+            raise XMRigManagerError(e, message = f"An error occurred adding miner '{miner_name}':") from e
 
     def remove_miner(self, miner_name):
         """
@@ -81,10 +105,11 @@ class XMRigManager:
                 raise ValueError(f"Miner with name '{miner_name}' does not exist.")
             if self._db_url is not None:
                 XMRigDatabase._delete_all_miner_data_from_db(miner_name, self._db_url)
-            del self._miners[miner_name]
+            self._miners.pop(miner_name).close()
+            self._miner_names = tuple(self._miners)
             log.info(f"Miner '{miner_name}' removed from manager.")
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred removing miner '{miner_name}':") from e
+            raise XMRigManagerError(e, message = f"An error occurred removing miner '{miner_name}':") from e
 
     def get_miner(self, miner_name):
         """
@@ -104,7 +129,7 @@ class XMRigManager:
                 raise ValueError(f"Miner with name '{miner_name}' does not exist.")
             return self._miners[miner_name]
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred retrieving miner '{miner_name}':") from e
+            raise XMRigManagerError(e, message = f"An error occurred retrieving miner '{miner_name}':") from e
     
     def edit_miner(self, miner_name, new_details):
         """
@@ -150,6 +175,7 @@ class XMRigManager:
                     # Remove old entry and replace with new entry
                     del self._miners[miner_name]
                     self._miners[value] = miner_api
+                    self._miner_names = tuple(self._miners)
                 elif key == "ip":
                     miner_api._ip = value
                 elif key == "port":
@@ -158,21 +184,57 @@ class XMRigManager:
                     miner_api.set_auth_header(value)
                 elif key == "tls_enabled":
                     miner_api._tls_enabled = value
-            # Get the miner API instance with the new name to edit further and then return
-            miner_api = self.get_miner(new_name)
-            # Check if keys "ip", "port" or "tls_enabled" are in the new_details dictionary to construct the new base URL
+            # Check if keys "ip", "port" or "tls_enabled" are in the new_details dictionary to rebuild the URLs 
+            # and discard the data cached from the old address
             if "ip" in new_details or "port" in new_details or "tls_enabled" in new_details:
-                miner_api._base_url = f"http://{miner_api._ip}:{miner_api._port}"
-                if miner_api._tls_enabled:
-                    self._base_url = f"https://{miner_api._ip}:{miner_api._port}"
+                miner_api._set_urls()
+                miner_api._clear_cache()
             log.info(f"Miner called '{miner_name}' successfully edited." if new_name == "" else f"Miner called '{miner_name}' successfully edited to '{new_name}'.")
             return miner_api
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred editing miner '{miner_name}':") from e
+            raise XMRigManagerError(e, message = f"An error occurred editing miner '{miner_name}':") from e
+
+    def _run_on_all(self, func):
+        """
+        Runs the supplied function against every miner concurrently using the manager's thread pool.
+
+        Args:
+            func (callable): Function accepting a single XMRigAPI instance.
+
+        Returns:
+            dict: Mapping of miner name to the function result, or the exception raised for that miner.
+        """
+        futures = {miner_name: self._pool.submit(func, miner_api) for miner_name, miner_api in list(self._miners.items())}
+        results = {}
+        for miner_name, future in futures.items():
+            try:
+                results[miner_name] = future.result()
+            except Exception as e:
+                results[miner_name] = e
+        return results
+
+    def _raise_for_errors(self, results, message):
+        """
+        Raises a single XMRigManagerError if any miner in the results raised an exception.
+
+        Args:
+            results (dict): Mapping of miner name to result or exception, as returned by `_run_on_all`.
+            message (str): Error message explaining the failed operation.
+
+        Raises:
+            XMRigManagerError: If one or more miners raised an exception.
+        """
+        errors = {miner_name: result for miner_name, result in results.items() if isinstance(result, Exception)}
+        if errors:
+            details = "; ".join(f"'{miner_name}': {error}" for miner_name, error in errors.items())
+            raise XMRigManagerError(error = details, message = message) from next(iter(errors.values()))
 
     def perform_action_on_all(self, action):
         """
-        Performs the specified action on all miners.
+        Performs the specified action on all miners concurrently.
+
+        A failure on one miner does not prevent the action from being performed on the remaining miners, 
+        any errors are collected and raised together once all miners have been actioned.
 
         Args:
             action (str): The action to perform ('pause', 'resume', 'stop', 'start').
@@ -181,18 +243,24 @@ class XMRigManager:
             XMRigManagerError: If an error occurs while performing the action on all miners.
         """
         try:
-            for miner_name, miner_api in self._miners.items():
-                success = miner_api.perform_action(action)
-                if success:
-                    log.info(f"Action '{action}' successfully performed on '{miner_name}'.")
-                else:
-                    log.warning(f"Action '{action}' failed on '{miner_name}'.")
+            results = self._run_on_all(lambda miner_api: miner_api.perform_action(action))
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred performing action '{action}' on all miners:") from e
+            raise XMRigManagerError(e, message = f"An error occurred performing action '{action}' on all miners:") from e
+        for miner_name, success in results.items():
+            if isinstance(success, Exception):
+                log.error(f"Action '{action}' failed on '{miner_name}': {success}")
+            elif success:
+                log.info(f"Action '{action}' successfully performed on '{miner_name}'.")
+            else:
+                log.warning(f"Action '{action}' failed on '{miner_name}'.")
+        self._raise_for_errors(results, f"An error occurred performing action '{action}' on all miners:")
 
     def update_miners(self, endpoint=None):
         """
-        Updates all miners' cached data or calls a specific endpoint on all miners.
+        Updates all miners' cached data or calls a specific endpoint on all miners concurrently.
+
+        A failure on one miner does not prevent the remaining miners from being updated, any errors are 
+        collected and raised together once all miners have been updated.
 
         Args:
             endpoint (str, optional): The endpoint to call on each miner. If None, updates all cached data. Defaults to None.
@@ -204,31 +272,120 @@ class XMRigManager:
             XMRigManagerError: If an error occurs while updating the miners or calling the endpoint.
         """
         try:
-            for miner_name, miner_api in self._miners.items():
-                if endpoint:
-                    response = miner_api.get_endpoint(endpoint)
-                    if response:
-                        log.info(f"{endpoint.capitalize()} endpoint successfully called on '{miner_name}'.")
-                    else:
-                        log.warning(f"Failed to call '{endpoint}' endpoint on '{miner_name}'.")
-                else:
-                    success = miner_api.get_all_responses()
-                    if success:
-                        log.info(f"Miner called '{miner_name}' successfully updated.")
-                    else:
-                        log.warning(f"Failed to update miner '{miner_name}'.")
-            return True
+            if endpoint:
+                results = self._run_on_all(lambda miner_api: miner_api.get_endpoint(endpoint))
+            else:
+                results = self._run_on_all(lambda miner_api: miner_api.get_all_responses())
         except Exception as e:
-            raise XMRigManagerError(e, traceback.format_exc(), f"An error occurred updating miners or calling endpoint '{endpoint}' on all miners:") from e
+            raise XMRigManagerError(e, message = f"An error occurred updating miners or calling endpoint '{endpoint}' on all miners:") from e
+        for miner_name, success in results.items():
+            if isinstance(success, Exception):
+                log.error(f"Failed to update miner '{miner_name}': {success}")
+            elif endpoint:
+                if success:
+                    log.info(f"{endpoint.capitalize()} endpoint successfully called on '{miner_name}'.")
+                else:
+                    log.warning(f"Failed to call '{endpoint}' endpoint on '{miner_name}'.")
+            else:
+                if success:
+                    log.info(f"Miner called '{miner_name}' successfully updated.")
+                else:
+                    log.warning(f"Failed to update miner '{miner_name}'.")
+        self._raise_for_errors(results, f"An error occurred updating miners or calling endpoint '{endpoint}' on all miners:")
+        return True
+
+    async def update_miners_async(self):
+        """
+        Updates all miners' cached data concurrently from within an asyncio event loop.
+
+        Each miner fetches its endpoints concurrently as well, so the total wait is roughly that of the 
+        slowest endpoint on the slowest miner. Any errors are collected and raised together once all 
+        miners have been updated.
+
+        Returns:
+            bool: True if successful, or False if an error occurred.
+
+        Raises:
+            XMRigManagerError: If an error occurs while updating the miners.
+        """
+        miners = list(self._miners.items())
+        responses = await asyncio.gather(*(miner_api.get_all_responses_async() for _, miner_api in miners), return_exceptions=True)
+        results = {miner_name: response for (miner_name, _), response in zip(miners, responses)}
+        for miner_name, success in results.items():
+            if isinstance(success, Exception):
+                log.error(f"Failed to update miner '{miner_name}': {success}")
+            elif success:
+                log.info(f"Miner called '{miner_name}' successfully updated.")
+            else:
+                log.warning(f"Failed to update miner '{miner_name}'.")
+        self._raise_for_errors(results, "An error occurred updating all miners:")
+        return True
+
+    def fleet_hashrate(self):
+        """
+        Totals the hashrate of all miners from their cached summary data.
+
+        Only the data already cached for each miner is used, nothing is fetched. Miners without cached hashrate 
+        data, or without a value for one of the periods, are skipped for that period.
+
+        Returns:
+            list: Combined hashrate for the last 10 seconds, 1 minute and 15 minutes.
+        """
+        totals = [0.0, 0.0, 0.0]
+        for miner_api in list(self._miners.values()):
+            try:
+                hashrates = miner_api._summary_cache["hashrate"]["total"]
+            except (KeyError, TypeError):
+                continue
+            if not isinstance(hashrates, list):
+                continue
+            for i, hashrate in enumerate(hashrates[:3]):
+                if hashrate is not None:
+                    totals[i] += hashrate
+        return totals
 
     def list_miners(self):
         """
         Lists all managed miners.
 
+        The names are kept up to date as miners are added, removed or renamed, so this does not need to walk 
+        the managed miners on every call.
+
         Returns:
-            list: A list of miner names.
+            tuple: The names of the managed miners.
+        """
+        return self._miner_names
+
+    def close(self):
         """
-        return list(self._miners.keys())
+        Closes every managed miner's connections and background threads, then stops the manager's thread pool.
+
+        The manager should not be used after it has been closed, it can also be used as a context manager to 
+        close it automatically.
+        """
+        for miner_api in list(self._miners.values()):
+            miner_api.close()
+        self._pool.shutdown()
+        log.debug("XMRigManager closed.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+@functools.lru_cache(maxsize=1)
+def default_manager():
+    """
+    Returns a process-wide XMRigManager instance, creating it on first use.
+
+    Code which calls this repeatedly within the same process shares one set of miners along with their 
+    connection pools and cached data, instead of creating and re-adding them each time.
+
+    Returns:
+        XMRigManager: The shared manager instance.
+    """
+    return XMRigManager(db_url = _DEFAULT_DB_URL)
 
 # Define the public interface of the module
-__all__ = ["XMRigManager"]
\ No newline at end of file
+__all__ = ["XMRigManager", "default_manager"]
\ No newline at end of file